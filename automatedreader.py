@@ -4,26 +4,16 @@ Created on Jul 22, 2017
 @author: David Gruskin 
 '''
 import pandas as pd
-import numpy as np
 import os
-import asi_scoring
-import bapq_scoring
-import bis_scoring
-import bisbas_scoring
-import dospert_s_scoring
-import dospert40_scoring
-import ecrr10_scoring
-import neoffi_scoring
-import pss_scoring
-import qids_scoring
-import rsqa_scoring
-import rsri_scoring
-import saqa_scoring
-import sni_scoring
-import stai_scoring
-import panas_scoring
-import tci_scoring
-import bis_scoring
+import column_dictionary
+import encoded_store
+import incremental_scoring
+import item_codes
+import result_cache
+import results_store
+import run_report
+import scale_registry
+import scoring_utils
 
 
 def main():  
@@ -38,8 +28,8 @@ def main():
 	headerfilepath= '/Users/ra1/NFC_columndictionary.csv'
 
 	# List all of the questionnaires you plan on using:
-	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,RSQA,RSRI,SAQ-A,SNI,STAI,TCI'
-	questionnaire_list= 'NFC(S)'
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,PSS,STAI'
 
 	# Provide the name of your output file here:
 	output_name= 'output1234'
@@ -47,101 +37,301 @@ def main():
 	# Define how "Prefer not to answer" responses are listed in your data:
 	prefertonotanswer= "Prefer not to answer"
 
+	# Number of processes used to score the questionnaires side by side (None uses every core, 1 scores them one at a time):
+	max_workers= None
+
+	# Number of rows to read and score at a time, for exports too large to load at once (None loads the whole file).
+	# Each chunk is checked on its own, so a response a questionnaire does not accept stops a chunked run
+	# (see check_chunk_columns) where a whole-file run would give that questionnaire's error column:
+	chunksize= None
+
+	# Only read the columns the listed questionnaires score, plus SUBJECT_ID (False reads every column).
+	# Total_Prefer_to_Not_Answer then counts "Prefer not to answer" across those columns only:
+	load_selected_columns= True
+
+	# Folder for the encoded item store (None always reads the csv). The first run on an export saves its
+	# cleaned responses there as small integer codes, and later runs read those instead of the csv:
+	encoded_store_dir= None
+
+	# Only score respondents who are new or whose responses changed since the last run with the same
+	# output file, and keep everyone else's previous scores (False scores every respondent):
+	incremental= False
+
+	# Folder for cached scale results (None turns the cache off). A scale scored before on the same responses
+	# with the same scoring script is read from the cache. Clear it with: python result_cache.py clear <folder>
+	result_cache_dir= None
+
+	# Largest size of the result cache in megabytes; the least recently used results are removed first:
+	result_cache_mb= 500
+
+	# Save the wall time, CPU time and peak memory of each stage and scale to <output_name>.report.json.
+	# Measuring memory slows the run down, so leave this off unless you are looking for what is slow:
+	save_run_report= False
+
+	# Also print those numbers as a table when the run finishes:
+	print_run_report= False
+
+	# SQLite file every run's scores are added to, one table per questionnaire (None turns it off).
+	# Look up one participant with: python results_store.py history <file> <SUBJECT_ID>
+	results_db= None
+
+	# Wave these responses belong to, saved with the scores in results_db (for example 'baseline' or 'followup_1'):
+	wave= None
+
+	# Keep the items of the questionnaires described in scale_specs.py as one byte per response and score them
+	# with kernel_scoring, which gives the same scores with far less memory. The other questionnaires are
+	# still cleaned as text and scored by their *_analysis functions (False scores every questionnaire that way).
+	# A response that is neither one of a questionnaire's labels nor a number (such as "banana") is listed as not
+	# accepted when scored from item codes, but stops the run with a ValueError when scored by *_analysis:
+	score_from_codes= True
+
+	# For the questionnaires scored from item codes, score the rows that only hold accepted responses and give
+	# the other rows the questionnaire's error column, listing their offending items (False gives every row
+	# the error column as soon as one response is not accepted). Every response that is not accepted is
+	# listed with its row, SUBJECT_ID and item in <output_name>.violations.csv either way:
+	score_clean_rows= False
+
+	ranges, violations = score_export(datafilepath, headerfilepath, questionnaire_list, output_name, prefertonotanswer, max_workers=max_workers,
+		chunksize=chunksize, load_selected_columns=load_selected_columns, encoded_store_dir=encoded_store_dir,
+		incremental=incremental, result_cache_dir=result_cache_dir, result_cache_mb=result_cache_mb,
+		save_run_report=save_run_report, print_run_report=print_run_report, results_db=results_db, wave=wave,
+		score_from_codes=score_from_codes, score_clean_rows=score_clean_rows)
+	if len(ranges):
+		print("%d scores fall outside the accepted range of their scale- see %s" % (ranges['flagged'].sum(), range_report_path(output_name)))
+	if len(violations):
+		print("%d responses are not accepted by their scale- see %s" % (len(violations), violations_path(output_name)))
+	print("Your output has been saved- have a great day!")
+
+
+# ------------------------------------------------------------------------------
+# Score one export and save the output. main() and batchreader both call this; the keyword
+# arguments are the settings described at the top of main(). Returns the range report of the output
+# (see scoring_utils.range_report) and the responses the scales scored from item codes do not accept
+# (see item_codes.violation_table), each also saved next to the output when it is not empty.
+def score_export(datafilepath, headerfilepath, questionnaire_list, output_name, prefertonotanswer, max_workers=None,
+		chunksize=None, load_selected_columns=True, encoded_store_dir=None, incremental=False, result_cache_dir=None,
+		result_cache_mb=500, save_run_report=False, print_run_report=False, results_db=None, wave=None, score_from_codes=False,
+		score_clean_rows=False):
+	report = None
+	if save_run_report or print_run_report:
+		report = run_report.start_report([('datafilepath', datafilepath), ('questionnaire_list', questionnaire_list),
+			('max_workers', max_workers), ('chunksize', chunksize), ('load_selected_columns', load_selected_columns),
+			('encoded_store_dir', encoded_store_dir), ('incremental', incremental), ('result_cache_dir', result_cache_dir),
+			('score_from_codes', score_from_codes), ('score_clean_rows', score_clean_rows), ('pandas', pd.__version__)])
+
 	#------------------------------------------------------------------------------------
-	# Convert data into a dataframe
-	raw_data_frame = pd.read_csv(datafilepath)
-	question_dict  = pd.read_csv(headerfilepath)
+	# Convert data into a dataframe, one chunk of rows at a time if chunksize is set.
+	# Each scored chunk is appended to the output file, so only one chunk is held in memory.
+	# The column dictionary is checked against the header row before any responses are read
+	dictionary = column_dictionary.compile_dictionary(headerfilepath, column_dictionary.read_header(datafilepath))
+	all_column_names = dictionary.names
+	needed = column_dictionary.column_positions(dictionary, scale_registry.selected_columns(scale_registry.selected_scales(questionnaire_list)))
+	column_names = all_column_names
+	usecols = None
+	if load_selected_columns:
+		usecols = needed
+		column_names = [all_column_names[i] for i in usecols]
+	coded_scales = []
+	violations = []
+	if score_from_codes:
+		coded_scales = item_codes.coded_scales(scale_registry.selected_scales(questionnaire_list))
+
+	if encoded_store_dir is None:
+		frames = normalized_chunks(read_chunks(datafilepath, usecols, chunksize), column_names, prefertonotanswer, report, coded_scales, violations)
+	else:
+		# The store always holds every column, so later runs can pick any questionnaires from it
+		store_path = encoded_store.store_path(encoded_store_dir, datafilepath, headerfilepath, prefertonotanswer)
+		if not os.path.exists(store_path):
+			with run_report.measure(report, 'build encoded store'):
+				encoded_store.build_store(store_path, read_chunks(datafilepath, None, chunksize), all_column_names, prefertonotanswer)
+		with run_report.measure(report, 'load encoded store'):
+			store = encoded_store.load_store(store_path)
+		frames = run_report.measured_items(report, 'decode encoded store', encoded_store.store_frames(store, usecols, chunksize))
+		if coded_scales:
+			frames = ((coded_data_frame(df, coded_scales, violations), total_prefernotanswer) for df, total_prefernotanswer in frames)
+
+	cache = None
+	if result_cache_dir is not None:
+		cache = result_cache.ResultCache(result_cache_dir, result_cache_mb * 1024 * 1024)
+
+	# The previous output is read in full before it is overwritten
+	if incremental:
+		with run_report.measure(report, 'load previous output'):
+			previous = incremental_scoring.load_previous(output_name)
+		key = incremental_scoring.settings_key(questionnaire_list, prefertonotanswer, score_clean_rows)
+		subject_ids = []
+		fingerprints = []
+
+	# The output is written to a temporary file and moved into place once every chunk is saved,
+	# so output_name never holds a partly written file
+	temporary = '%s.tmp%d' % (output_name, os.getpid())
+	ranges = []
+
+	# The scores of the whole run are added to the results store in one transaction when it finishes
+	store = None
+	if results_db is not None:
+		store = results_store.start_run(results_db, wave, datafilepath, questionnaire_list, output_name)
+	try:
+		with scale_registry.scoring_pool(max_workers, scale_registry.selected_scales(questionnaire_list), coded_scales) as executor:
+			for chunk_number, (df, total_prefernotanswer) in enumerate(frames):
+				if incremental:
+					with run_report.measure(report, 'fingerprints'):
+						chunk_fingerprints = incremental_scoring.row_fingerprints(df, total_prefernotanswer, key)
+					output = score_changed_rows(df, total_prefernotanswer, chunk_fingerprints, previous, questionnaire_list, executor, cache, report, store,
+						score_clean_rows)
+					subject_ids += list(df['SUBJECT_ID'])
+					fingerprints += chunk_fingerprints
+				else:
+					output = score_normalized_data_frame(df, total_prefernotanswer, questionnaire_list, executor, cache, report, store, score_clean_rows)
+				with run_report.measure(report, 'range report'):
+					ranges.append(scoring_utils.range_report([output], df['SUBJECT_ID']))
+				with run_report.measure(report, 'write output'):
+					if chunk_number == 0:
+						header = list(output.columns)
+						output.to_csv(temporary)
+					else:
+						check_chunk_columns(output, header)
+						output.to_csv(temporary, mode='a', header=False)
+	except BaseException:
+		if store is not None:
+			results_store.finish_run(store, failed=True)
+		if os.path.exists(temporary):
+			os.remove(temporary)
+		raise
+	os.replace(temporary, output_name)
+	ranges = save_range_report(scoring_utils.merge_range_reports(ranges), output_name)
+	violations = [table for table in violations if len(table)]
+	violations = save_violations(pd.concat(violations, ignore_index=True) if violations else pd.DataFrame(columns=item_codes.violation_columns),
+		output_name)
+	if incremental:
+		with run_report.measure(report, 'save fingerprints'):
+			incremental_scoring.save_fingerprints(output_name, subject_ids, fingerprints)
+	if store is not None:
+		with run_report.measure(report, 'commit results store'):
+			results_store.finish_run(store)
+	if report is not None:
+		total = run_report.stop_report(report)
+		if save_run_report:
+			run_report.save_report(report, output_name, total)
+		if print_run_report:
+			run_report.print_report(report, total)
+	return ranges, violations
+
+# Every chunk is appended under the header of the first, so it must give the same columns. They differ when
+# a questionnaire has responses it does not accept in some chunks only: its *_analysis function then gives the
+# rows of those chunks its error column instead of its scores.
+def check_chunk_columns(output, header):
+	if list(output.columns) == header:
+		return
+	differing = [column for column in output.columns if column not in header] + [column for column in header if column not in output.columns]
+	raise ValueError("Rows %s to %s of your export give different output columns than the rows before them (%s), so they cannot be "
+		"added to the same output. A questionnaire with responses it does not accept is reported as its error column for the "
+		"rows scored together with them. Please fix those responses, score the export without chunksize, or set score_clean_rows "
+		"for the questionnaires scored from item codes."
+		% (output.index[0], output.index[-1], ', '.join(str(column) for column in differing[:5])))
+
+# Return where the range report of an output is saved
+def range_report_path(output_name):
+	return output_name + '.range_warnings.csv'
+
+# Save the range report next to the output, or remove an old one when no score is flagged
+def save_range_report(ranges, output_name):
+	path = range_report_path(output_name)
+	if len(ranges):
+		ranges.to_csv(path, index=False)
+	elif os.path.exists(path):
+		os.remove(path)
+	return ranges
+
+# Return where the responses the scales do not accept are saved
+def violations_path(output_name):
+	return output_name + '.violations.csv'
+
+# Save the responses the scales do not accept next to the output, or remove an old list when there are none
+def save_violations(violations, output_name):
+	path = violations_path(output_name)
+	if len(violations):
+		violations.to_csv(path, index=False)
+	elif os.path.exists(path):
+		os.remove(path)
+	return violations
+
+# Read the data csv whole, or chunksize rows at a time. Nothing is read until the first chunk is asked for.
+def read_chunks(datafilepath, usecols=None, chunksize=None):
+	if chunksize is None:
+		yield pd.read_csv(datafilepath, usecols=usecols)
+	else:
+		yield from pd.read_csv(datafilepath, usecols=usecols, chunksize=chunksize)
+
+# Clean each chunk read from the csv. With a run report, reading and cleaning are measured as separate stages.
+def normalized_chunks(chunks, column_names, prefertonotanswer, report=None, coded_scales=(), violations=None):
+	for raw_data_frame in run_report.measured_items(report, 'read csv', chunks):
+		with run_report.measure(report, 'clean responses'):
+			frame = normalize_data_frame(raw_data_frame, column_names, prefertonotanswer, coded_scales, violations)
+		yield frame
+
+# Score one data frame (the whole export or one chunk of it) and return the combined results.
+# Every *_analysis function works row by row, so scoring chunks gives the same rows as scoring the whole file,
+# as long as every response is accepted: a failed validation gives the error column for the rows scored together.
+def score_data_frame(raw_data_frame, column_names, questionnaire_list, prefertonotanswer, executor=None):
+	df, total_prefernotanswer = normalize_data_frame(raw_data_frame, column_names, prefertonotanswer)
+	return score_normalized_data_frame(df, total_prefernotanswer, questionnaire_list, executor)
+
+# Name the columns, count the "Prefer not to answer" responses of each row and clean the responses.
+# The items of coded_scales are stored as item codes instead (see coded_data_frame).
+def normalize_data_frame(raw_data_frame, column_names, prefertonotanswer, coded_scales=(), violations=None):
 	df = pd.DataFrame(raw_data_frame) 
-	df.columns = question_dict['COLUMN_NAME']
+	df.columns = column_names
 	df= df.replace([prefertonotanswer], [999])
-	total_prefernotanswer= df.apply(lambda x: sum(x== 999), axis=1)
+	total_prefernotanswer= scoring_utils.prefer_not_to_answer_total(df)
 	total_prefernotanswer= pd.DataFrame({'Total_Prefer_to_Not_Answer' : total_prefernotanswer})
-	df= df.replace([np.nan], ['99999'])
-	df=df.apply(lambda x:x.astype(str).str.lower())
-	df= df.replace(['99999'], [np.nan])
+	if coded_scales:
+		return coded_data_frame(df, coded_scales, violations), total_prefernotanswer
+	df=df.apply(scoring_utils.normalize_responses)
+	return df, total_prefernotanswer
 
+# Replace the items of the named scales by int8 item codes (see item_codes.py), one byte per response,
+# and clean the other columns as text. scale_registry.score_scale scores the coded scales with kernel_scoring.
+# The responses the scales do not accept are added to violations, when given, as a data frame (see item_codes.violation_table).
+def coded_data_frame(df, coded_scales, violations=None):
+	codes = item_codes.encode_items(coded_scales, df)
+	if violations is not None:
+		violations.append(item_codes.violation_table(codes))
+	coded = set(codes.columns)
+	text = df.iloc[:, [j for j, column in enumerate(df.columns) if column not in coded]]
+	return pd.concat([text.apply(scoring_utils.normalize_responses), item_codes.code_frame(codes)], axis=1)
+
+# Score the selected questionnaires from cleaned responses
+def score_normalized_data_frame(df, total_prefernotanswer, questionnaire_list, executor=None, cache=None, report=None, store=None,
+		score_clean_rows=False):
 	# Score the scales   
-	df_results=pd.DataFrame()
-	if "ASI" in questionnaire_list:
-		asi_result= asi_scoring.asi_analysis(df)
-		df_results=[df_results,asi_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "BAPQ" in questionnaire_list:
-		bapq_result= bapq_scoring.bapq_analysis(df)
-		df_results=[df_results,bapq_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "BARRATT" in questionnaire_list:
-		barratt_result= bis_scoring.bis_analysis(df)
-		df_results=[df_results,barratt_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "BIS/BAS" in questionnaire_list:
-		bisbas_result= bisbas_scoring.bisbas_analysis(df)
-		df_results= [df_results,bisbas_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "DOSPERT(S)" in questionnaire_list:
-		dospert_s_result = dospert_s_scoring.dospert_s_analysis(df)
-		df_results=[df_results,dospert_s_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "DOSPERT(40)" in questionnaire_list:
-		dospert40_result = dospert40_scoring.dospert40_analysis(df)
-		df_results=[df_results,dospert40_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "ECR-R10" in questionnaire_list:
-		ecrr10_result= ecrr10_scoring.ecrr10_analysis(df)
-		df_results=[df_results,ecrr10_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "NEO-FFI" in questionnaire_list:
-		neoffi_result= neoffi_scoring.neoffi_analysis(df)
-		df_results=[df_results,neoffi_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "NFC(S)" in questionnaire_list:
-		nfc_s_result= nfc_s_scoring.nfc_s_analysis(df)
-		df_results=[df_results,nfc_s_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "PANAS" in questionnaire_list:
-		panas_result= panas_scoring.panas_analysis(df)
-		df_results=[df_results,panas_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "PSS" in questionnaire_list:
-		pss_result= pss_scoring.pss_analysis(df)
-		df_results=[df_results,pss_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "QIDS" in questionnaire_list:
-		qids_result= qids_scoring.qids_analysis(df)
-		df_results=[df_results,qids_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "A-RSQ" in questionnaire_list:
-		rsqa_result= rsqa_scoring.rsqa_analysis(df)
-		df_results=[df_results,rsqa_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "RSRI" in questionnaire_list:
-		rsri_result= rsri_scoring.rsri_analysis(df)
-		df_results=[df_results,rsri_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "SAQ-A" in questionnaire_list:
-		saqa_result= saqa_scoring.saqa_analysis(df)
-		df_results=[df_results,saqa_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "SNI" in questionnaire_list:
-		sni_result= sni_scoring.sni_analysis(df)
-		df_results=[df_results,sni_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "STAI" in questionnaire_list:
-		stai_result= stai_scoring.stai_analysis(df)
-		df_results=[df_results,stai_result]
-		df_results=pd.concat(df_results, axis=1)
-	if "TCI" in questionnaire_list:
-		tci_result= tci_scoring.tci_analysis(df)
-		df_results=[df_results,bis_result]
-		df_results=pd.concat(df_results, axis=1)
+	scale_names= scale_registry.selected_scales(questionnaire_list)
+	if cache is None:
+		scale_results= scale_registry.score_scales(df, scale_names, executor, report, score_clean_rows)
+	else:
+		scale_results= result_cache.cached_scales(cache, df, scale_names, executor, report, score_clean_rows)
+	if store is not None:
+		with run_report.measure(report, 'save results store'):
+			results_store.save_results(store, scale_names, scale_results, df['SUBJECT_ID'])
 		
-	# Combine the results into one spreadsheet and save as output
-	df_results=[df_results, total_prefernotanswer]
-	df_results=pd.concat(df_results, axis=1)
-	df_results = df_results.loc[:,~df_results.columns.duplicated()]
-	output=df_results
-	output.to_csv(output_name)
-	print "Your output has been saved- have a great day!"
+	# Combine the results into one spreadsheet
+	with run_report.measure(report, 'combine results'):
+		df_results= scale_registry.combine_results(scale_results + [total_prefernotanswer])
+	return df_results
+
+# Score only the rows without a matching fingerprint in the previous run, and take the other rows from the previous output
+def score_changed_rows(df, total_prefernotanswer, fingerprints, previous, questionnaire_list, executor=None, cache=None, report=None, store=None,
+		score_clean_rows=False):
+	if previous is None:
+		return score_normalized_data_frame(df, total_prefernotanswer, questionnaire_list, executor, cache, report, store, score_clean_rows)
+	unchanged = incremental_scoring.previous_rows(previous, df['SUBJECT_ID'], fingerprints)
+	changed = ~df.index.isin(unchanged.index)
+	if not changed.any():
+		return unchanged
+	scored = score_normalized_data_frame(df[changed], total_prefernotanswer[changed], questionnaire_list, executor, cache, report, store,
+		score_clean_rows)
+	return pd.concat([unchanged, scored]).loc[df.index]
 
 
-main()
\ No newline at end of file
+if __name__ == '__main__':
+	main()
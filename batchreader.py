@@ -0,0 +1,128 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import glob
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import automatedreader
+
+# BATCH SCORING
+
+# Scores every export matching datapattern in one run, one export per process, and saves an output
+# for each export plus one combined output. Each export is paired with <name>_columndictionary.csv
+# from its own folder, or with headerfilepath when it has none. Outputs are named after the path of the
+# export below the folder of datapattern, so sites/a/export.csv and sites/b/export.csv found with
+# 'sites/*/export.csv' are saved as a_export_output.csv and b_export_output.csv.
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# Define the folder or pattern of the data csvs here:
+	datapattern = '/Users/ra1/exports/*.csv'
+
+	# Define the column dictionary used by exports without their own <name>_columndictionary.csv:
+	headerfilepath= '/Users/ra1/NFC_columndictionary.csv'
+
+	# List all of the questionnaires you plan on using:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,PSS,STAI'
+
+	# Define the folder the outputs are saved in:
+	output_dir= '/Users/ra1/scores'
+
+	# Provide the name of the combined output file here:
+	combined_output_name= 'combined_output.csv'
+
+	# Define how "Prefer not to answer" responses are listed in your data:
+	prefertonotanswer= "Prefer not to answer"
+
+	# Number of exports scored side by side (None uses every core, 1 scores them one at a time):
+	max_workers= None
+
+	# Settings passed on to automatedreader.score_export for every export (see automatedreader.main):
+	export_settings= {'chunksize': None, 'load_selected_columns': True, 'encoded_store_dir': None,
+		'incremental': False, 'result_cache_dir': None, 'result_cache_mb': 500, 'save_run_report': False,
+		'results_db': None, 'wave': None, 'score_from_codes': True,
+		'score_clean_rows': False}
+
+	#------------------------------------------------------------------------------------
+	exports = find_exports(datapattern, headerfilepath)
+	output_names = score_exports(exports, questionnaire_list, output_dir, prefertonotanswer, max_workers, export_settings, datapattern)
+	combine_outputs([datafilepath for datafilepath, dictionary in exports], output_names, os.path.join(output_dir, combined_output_name))
+	print("Your %d outputs have been saved- have a great day!" % len(output_names))
+
+
+# ------------------------------------------------------------------------------
+# Return (data csv, column dictionary) for every export matching datapattern, sorted by path.
+# Raises a ValueError when two exports would be saved to the same output file (see output_path).
+def find_exports(datapattern, headerfilepath):
+	if os.path.isdir(datapattern):
+		datapattern = os.path.join(datapattern, '*.csv')
+	exports = []
+	for datafilepath in sorted(glob.glob(datapattern)):
+		if datafilepath.endswith('_columndictionary.csv') or os.path.abspath(datafilepath) == os.path.abspath(headerfilepath):
+			continue
+		dictionary = os.path.splitext(datafilepath)[0] + '_columndictionary.csv'
+		exports.append((datafilepath, dictionary if os.path.exists(dictionary) else headerfilepath))
+	outputs = OrderedDict()
+	for datafilepath, dictionary in exports:
+		outputs.setdefault(output_path('', datafilepath, datapattern), []).append(datafilepath)
+	for datafilepaths in outputs.values():
+		if len(datafilepaths) > 1:
+			raise ValueError("Your exports %s would be saved to the same output file. Please rename one of them." % ' and '.join(datafilepaths))
+	return exports
+
+# Return the folder the exports matching datapattern are found below: datapattern up to its first wildcard
+def pattern_root(datapattern):
+	root = datapattern
+	while root and (glob.has_magic(root) or not os.path.isdir(root)) and os.path.dirname(root) != root:
+		root = os.path.dirname(root)
+	return root or os.curdir
+
+# Return the output file of one export found with datapattern, named after its path below pattern_root
+def output_path(output_dir, datafilepath, datapattern):
+	relative = os.path.splitext(os.path.relpath(datafilepath, pattern_root(datapattern)))[0]
+	return os.path.join(output_dir, relative.replace(os.sep, '_') + '_output.csv')
+
+# Score every export across a process pool and return the output file names, in the order of exports.
+# The scales of one export are scored in its own process, so each export uses max_workers=1. datapattern
+# is the pattern the exports were found with, which their output files are named from (see output_path).
+def score_exports(exports, questionnaire_list, output_dir, prefertonotanswer, max_workers=None, export_settings=None, datapattern=''):
+	if export_settings is None:
+		export_settings = {}
+	if not os.path.isdir(output_dir):
+		os.makedirs(output_dir)
+	output_names = [output_path(output_dir, datafilepath, datapattern) for datafilepath, dictionary in exports]
+	jobs = []
+	with ProcessPoolExecutor(max_workers=max_workers) as executor:
+		for (datafilepath, dictionary), output_name in zip(exports, output_names):
+			jobs.append(executor.submit(automatedreader.score_export, datafilepath, dictionary, questionnaire_list,
+				output_name, prefertonotanswer, max_workers=1, **export_settings))
+		for job in jobs:
+			job.result()
+	return output_names
+
+# Stack the outputs into one file, with the path of the export each row came from in the Source_File column
+def combine_outputs(datafilepaths, output_names, combined_output_name):
+	outputs = []
+	for datafilepath, output_name in zip(datafilepaths, output_names):
+		output = pd.read_csv(output_name, index_col=0, float_precision='round_trip')
+		output.insert(0, 'Source_File', datafilepath)
+		outputs.append(output)
+	if outputs:
+		pd.concat(outputs).to_csv(combined_output_name)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,163 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import json
+import os
+import platform
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+import automatedreader
+import scale_registry
+import synthetic_data
+
+# BENCHMARK
+
+# Times every selected *_analysis function, and the whole automatedreader pipeline, on synthetic exports
+# (see synthetic_data.py) of growing size, and compares the times with a saved baseline. Save a baseline
+# on a machine once, then run the benchmark again after a change to see which scales got slower.
+#
+# A scale that takes longer than max_seconds at one size is not timed at the larger sizes, and a scale
+# that raises is reported as failed. The pipeline is timed over the scales that scored at the first size.
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# List all of the questionnaires to time:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+
+	# Numbers of respondents to time them at:
+	row_counts= [1000, 10000, 100000, 1000000]
+
+	# Number of times each scale is timed at each size; the fastest time is kept:
+	repeats= 1
+
+	# Seconds after which a scale is not timed at larger sizes:
+	max_seconds= 60
+
+	# Folder the synthetic exports and outputs are written to:
+	work_dir= '/Users/ra1/benchmark'
+
+	# File the baseline times are saved in and compared with:
+	baseline_path= '/Users/ra1/benchmark/baseline.json'
+
+	# Save this run's times as the new baseline (False only compares with the saved one):
+	save_baseline= False
+
+	# Times more than this share slower than the baseline are marked as regressions:
+	tolerance= 0.25
+
+	#------------------------------------------------------------------------------------
+	results = run_benchmark(scale_registry.selected_scales(questionnaire_list), row_counts, work_dir, repeats, max_seconds)
+	baseline = load_baseline(baseline_path)
+	print_comparison(results, baseline, tolerance)
+	if save_baseline:
+		save_results(baseline_path, results)
+		print("Your baseline has been saved to %s" % baseline_path)
+
+
+# ------------------------------------------------------------------------------
+# Timing
+
+# Return the fastest of repeats calls of function(), in seconds
+def best_time(function, repeats=1):
+	times = []
+	for repeat in range(repeats):
+		start = time.perf_counter()
+		function()
+		times.append(time.perf_counter() - start)
+	return min(times)
+
+# Time each scale on its own cleaned columns, the way score_scales hands them over. Returns name -> seconds,
+# or name -> the exception's name when the scale cannot score the export.
+def time_scales(df, names, repeats=1):
+	times = OrderedDict()
+	for name in names:
+		frame = df[scale_registry.scale_columns(name)]
+		try:
+			times[name] = best_time(lambda: scale_registry.score_scale(name, frame.copy()), repeats)
+		except Exception as error:
+			times[name] = type(error).__name__
+	return times
+
+# Time the whole pipeline, from reading the csv to writing the output, with the scales scored one at a time
+def time_pipeline(datafilepath, headerfilepath, names, output_name, repeats=1):
+	return best_time(lambda: automatedreader.score_export(datafilepath, headerfilepath, ','.join(names), output_name,
+		"Prefer not to answer", max_workers=1), repeats)
+
+# Time the named scales and the pipeline at each row count. Returns an OrderedDict from the row count
+# (as text, as it is saved) to the times of that size: name -> seconds or failure, plus 'pipeline'.
+def run_benchmark(names, row_counts, work_dir, repeats=1, max_seconds=60):
+	if not os.path.isdir(work_dir):
+		os.makedirs(work_dir)
+	results = OrderedDict()
+	timed = list(names)
+	pipeline = None
+	for rows in row_counts:
+		needed = [name for name in names if name in timed or (pipeline and name in pipeline)]
+		if not needed:
+			break
+		datafilepath = os.path.join(work_dir, 'synthetic_%d.csv' % rows)
+		headerfilepath = os.path.join(work_dir, 'synthetic_%d_columndictionary.csv' % rows)
+		synthetic_data.write_export(datafilepath, headerfilepath, needed, rows)
+		column_names = list(pd.read_csv(headerfilepath)['COLUMN_NAME'])
+		df, total_prefernotanswer = automatedreader.normalize_data_frame(pd.read_csv(datafilepath), column_names, "Prefer not to answer")
+
+		times = time_scales(df, timed, repeats)
+		if pipeline is None:
+			pipeline = [name for name in timed if not isinstance(times[name], str)]
+		if pipeline:
+			times['pipeline'] = time_pipeline(datafilepath, headerfilepath, pipeline, os.path.join(work_dir, 'output_%d.csv' % rows), repeats)
+			if times['pipeline'] > max_seconds:
+				pipeline = []
+		results[str(rows)] = times
+		print("Timed %d rows" % rows)
+		timed = [name for name in timed if not isinstance(times[name], str) and times[name] <= max_seconds]
+	return results
+
+# ------------------------------------------------------------------------------
+# Baselines
+
+# Read a saved baseline, or return None when there is none
+def load_baseline(baseline_path):
+	if not os.path.exists(baseline_path):
+		return None
+	with open(baseline_path) as baseline_file:
+		return json.load(baseline_file, object_pairs_hook=OrderedDict)
+
+# Save results as a baseline, with the machine and versions they were timed on
+def save_results(baseline_path, results):
+	contents = OrderedDict([('machine', platform.machine()), ('processor', platform.processor()),
+		('python', platform.python_version()), ('pandas', pd.__version__), ('results', results)])
+	with open(baseline_path, 'w') as baseline_file:
+		json.dump(contents, baseline_file, indent=2)
+
+# Print each time next to its baseline time. Times more than tolerance slower are marked REGRESSION.
+def print_comparison(results, baseline, tolerance=0.25):
+	saved = baseline['results'] if baseline is not None else {}
+	print("%-12s %9s %12s %12s %8s" % ('Scale', 'Rows', 'Seconds', 'Baseline', 'Ratio'))
+	for rows, times in results.items():
+		for name, seconds in times.items():
+			before = saved.get(rows, {}).get(name)
+			if isinstance(seconds, str):
+				print("%-12s %9s %12s %12s" % (name, rows, seconds, '' if before is None else before))
+				continue
+			if before is None or isinstance(before, str):
+				print("%-12s %9s %12.4f %12s" % (name, rows, seconds, '' if before is None else before))
+				continue
+			ratio = seconds / before if before else float('inf')
+			print("%-12s %9s %12.4f %12.4f %8.2f%s" % (name, rows, seconds, before, ratio, '  REGRESSION' if ratio > 1 + tolerance else ''))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,141 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import os
+from collections import namedtuple
+
+import automatedreader
+import incremental_check
+import scale_registry
+import synthetic_data
+
+# CHUNK CHECK
+
+# Scores a synthetic export (see synthetic_data.py) whole and chunksize rows at a time, and checks that the
+# chunked run gives the same files byte for byte. The export is then given one response its first scale does
+# not accept, in the last chunk: the whole run must report it as that scale's error column, the chunked run
+# must stop with a ValueError instead of writing chunks with different columns under one header, and with
+# score_clean_rows (for the scales scored from item codes) both runs must give the same files again.
+
+# One case of the check: what was scored and what went wrong ('' when it passed)
+ChunkCase = namedtuple('ChunkCase', ['name', 'problem'])
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# Folder the synthetic export and the outputs are written to (made if it does not exist):
+	folder= '/Users/ra1/chunk_check'
+
+	# List all of the questionnaires to check:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PSS,SAQ-A,STAI'
+
+	# Respondents of the export, and the rows scored at a time by the chunked runs:
+	rows= 200
+	chunksize= 70
+
+	# Synthetic answers (see synthetic_data.py):
+	blank_rate= 0.05
+	pna_rate= 0.05
+	seed= 0
+
+	# Settings passed on to automatedreader.score_export for every run (see automatedreader.main):
+	export_settings= {'max_workers': None, 'score_from_codes': True}
+
+	#------------------------------------------------------------------------------------
+	cases = check_chunks(folder, questionnaire_list, rows, chunksize, blank_rate, pna_rate, seed, export_settings)
+	print_cases(cases)
+
+
+# ------------------------------------------------------------------------------
+# Checking
+
+# Run the cases described at the top of this file and return them
+def check_chunks(folder, questionnaire_list, rows=200, chunksize=70, blank_rate=0.05, pna_rate=0.05, seed=0, export_settings=None,
+		prefertonotanswer="Prefer not to answer"):
+	if export_settings is None:
+		export_settings = {}
+	if not os.path.isdir(folder):
+		os.makedirs(folder)
+	names = scale_registry.selected_scales(questionnaire_list)
+	df = synthetic_data.synthetic_frame(names, rows, blank_rate, pna_rate, 0, prefertonotanswer, seed)
+	cases = [compare_runs('every response accepted', folder, df, questionnaire_list, chunksize, export_settings, prefertonotanswer)]
+
+	# One response the first scale does not accept, in the last row (so in a later chunk than the first)
+	column, (choices, invalid) = next(iter(synthetic_data.column_answers(names[0]).items()))
+	df.loc[rows - 1, column] = invalid
+	cases.append(chunked_error('%s=%s in row %d' % (column, invalid, rows - 1), folder, df, questionnaire_list, chunksize,
+		export_settings, prefertonotanswer))
+	clean_rows = dict(export_settings, score_from_codes=True, score_clean_rows=True)
+	cases.append(compare_runs('%s=%s in row %d, with score_clean_rows' % (column, invalid, rows - 1), folder, df, questionnaire_list,
+		chunksize, clean_rows, prefertonotanswer))
+	return cases
+
+# Score an export whole and chunked, and return a case that fails when the two give different files
+def compare_runs(name, folder, df, questionnaire_list, chunksize, export_settings, prefertonotanswer):
+	datafilepath, headerfilepath = save_case(folder, df)
+	whole_output = os.path.join(folder, 'whole_output.csv')
+	chunked_output = os.path.join(folder, 'chunked_output.csv')
+	automatedreader.score_export(datafilepath, headerfilepath, questionnaire_list, whole_output, prefertonotanswer,
+		**dict(export_settings, chunksize=None))
+	automatedreader.score_export(datafilepath, headerfilepath, questionnaire_list, chunked_output, prefertonotanswer,
+		**dict(export_settings, chunksize=chunksize))
+	differences = incremental_check.file_differences(chunked_output, whole_output)
+	if not differences:
+		return ChunkCase(name, '')
+	path, line, chunked_line, whole_line = differences[0]
+	return ChunkCase(name, '%s differs from the whole run at line %d: %s != %s' % (path, line, chunked_line[:80], whole_line[:80]))
+
+# Score an export whose chunks give different output columns, and return a case that fails unless the whole
+# run gives an error column and the chunked run raises a ValueError without leaving an output behind
+def chunked_error(name, folder, df, questionnaire_list, chunksize, export_settings, prefertonotanswer):
+	datafilepath, headerfilepath = save_case(folder, df)
+	whole_output = os.path.join(folder, 'whole_output.csv')
+	chunked_output = os.path.join(folder, 'chunked_output.csv')
+	if os.path.exists(chunked_output):
+		os.remove(chunked_output)
+	settings = dict(export_settings, score_clean_rows=False)
+	automatedreader.score_export(datafilepath, headerfilepath, questionnaire_list, whole_output, prefertonotanswer,
+		**dict(settings, chunksize=None))
+	with open(whole_output) as output:
+		if not any(column.endswith('_error') for column in output.readline().strip().split(',')):
+			return ChunkCase(name, 'the whole run gives no error column')
+	try:
+		automatedreader.score_export(datafilepath, headerfilepath, questionnaire_list, chunked_output, prefertonotanswer,
+			**dict(settings, chunksize=chunksize))
+	except ValueError:
+		if os.path.exists(chunked_output):
+			return ChunkCase(name, 'the chunked run raised a ValueError but left %s behind' % chunked_output)
+		return ChunkCase(name, '')
+	return ChunkCase(name, 'the chunked run wrote %s instead of raising a ValueError' % chunked_output)
+
+# Write the export of a case and its column dictionary, and return their paths
+def save_case(folder, df):
+	datafilepath = os.path.join(folder, 'export.csv')
+	headerfilepath = os.path.join(folder, 'columndictionary.csv')
+	synthetic_data.save_export(df, datafilepath, headerfilepath)
+	return datafilepath, headerfilepath
+
+# ------------------------------------------------------------------------------
+# Output
+
+# Print one line per case, then whether every case passed
+def print_cases(cases):
+	for case in cases:
+		print("%-60s %s" % (case.name, case.problem or 'ok'))
+	failed = [case.name for case in cases if case.problem]
+	if failed:
+		print("Chunked scoring failed %d of %d cases" % (len(failed), len(cases)))
+	else:
+		print("Chunked scoring passed every case")
+
+
+if __name__ == '__main__':
+	main()
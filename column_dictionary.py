@@ -0,0 +1,68 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+from collections import namedtuple
+
+import pandas as pd
+
+# COLUMN DICTIONARY
+
+# The column dictionary names the columns of an export. It can take two forms:
+#	- a COLUMN_NAME column only, listing the name of every column of the export in the same order;
+#	- a COLUMN_NAME column and a RAW_HEADER column, giving the export header each name stands for.
+#	  This form can name just the columns that are scored; any other column keeps its export header.
+# The dictionary is checked against the header row of the export before any responses are read, so a
+# dictionary that does not fit the export is reported straight away.
+
+# names holds the name of every column of the export, in order; positions maps each name to its columns.
+# Columns that are not scored may share a name or be left blank, as they could before the dictionary was checked.
+ColumnDictionary = namedtuple('ColumnDictionary', ['names', 'positions'])
+
+# ------------------------------------------------------------------------------
+# Reading
+
+# Return the header row of a data csv, without reading any responses
+def read_header(datafilepath):
+	return list(pd.read_csv(datafilepath, nrows=0).columns)
+
+# Compile the column dictionary for an export with the given header row
+def compile_dictionary(headerfilepath, header):
+	question_dict = pd.read_csv(headerfilepath, dtype=str, keep_default_na=False)
+	if 'COLUMN_NAME' not in question_dict.columns:
+		raise ValueError("The column dictionary %s has no COLUMN_NAME column" % headerfilepath)
+	if 'RAW_HEADER' not in question_dict.columns:
+		names = list(question_dict['COLUMN_NAME'])
+		if len(names) != len(header):
+			raise ValueError("The column dictionary %s lists %d columns but the export has %d. List every column of the export in order, or add a RAW_HEADER column giving the export header of each name." % (headerfilepath, len(names), len(header)))
+	else:
+		renamed = {}
+		for raw_header, name in zip(question_dict['RAW_HEADER'], question_dict['COLUMN_NAME']):
+			if raw_header in renamed and renamed[raw_header] != name:
+				raise ValueError("The column dictionary %s gives the export column %s two names (%s and %s)" % (headerfilepath, raw_header, renamed[raw_header], name))
+			renamed[raw_header] = name
+		missing = [raw_header for raw_header in renamed if raw_header not in header]
+		if missing:
+			raise ValueError("The export has no column %s, which the column dictionary %s names" % (', '.join(missing), headerfilepath))
+		names = [renamed.get(raw_header, raw_header) for raw_header in header]
+	positions = {}
+	for position, name in enumerate(names):
+		positions.setdefault(name, []).append(position)
+	return ColumnDictionary(names, positions)
+
+# ------------------------------------------------------------------------------
+# Lookups
+
+# Return the positions of the named columns in the export, in export order. Raises ValueError naming
+# every column that is missing, or that the dictionary gives to more than one column.
+def column_positions(dictionary, names):
+	missing = [name for name in names if name not in dictionary.positions]
+	if missing:
+		raise ValueError("Your export has no column named %s, which the selected questionnaires need. Please check your column dictionary." % ', '.join(missing))
+	repeated = [name for name in names if len(dictionary.positions[name]) > 1]
+	if repeated:
+		raise ValueError("Your column dictionary gives more than one column of the export the name %s, which the selected questionnaires need. Please check your column dictionary." % ', '.join(repeated))
+	return sorted(set(dictionary.positions[name][0] for name in names))
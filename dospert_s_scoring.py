@@ -10,7 +10,10 @@ Battery Scores Package for Processing Qualtrics CSV Files
 """
 import pandas as pd
 import numpy as np
+import scoring_utils
 import sys 
+from scale_specs import (dospert_s_risktaking_keys as risktaking_keys, dospert_s_riskperception_keys as riskperception_keys,
+	dospert_s_tot_keys)
 
 # DOMAIN-SPECIFIC RISK-TAKING SCALE (social items only)
 
@@ -38,75 +41,68 @@ This version uses only "Social" items from the 2003 DOSPERT (https://sites.googl
 # Subscale scores: min= 8  max= 56
 # ------------------------------------------------------------------------------
 # Data Preparation
+
+
 def dospert_s_analysis(df):
-	# These are the different headers and their corresponding questions
-	risktaking_keys = ['dospert_s_1', 'dospert_s_2', 'dospert_s_3', 'dospert_s_4', 'dospert_s_5', 'dospert_s_6', 'dospert_s_7',
-	'dospert_s_8']
-	
-	riskperception_keys = ['dospert_s_9', 'dospert_s_10', 'dospert_s_11', 'dospert_s_12', 'dospert_s_13', 'dospert_s_14', 'dospert_s_15', 'dospert_s_16']
-	
-	dospert_s_tot_keys=risktaking_keys+riskperception_keys
-				   
 	# Replace Qualtrics text answers with numerical values
 	df[dospert_s_tot_keys]= df[dospert_s_tot_keys].replace(['very unlikely', 'unlikely','not sure','likely', 'very likely'], [1,2,3,4,5])
 	df[dospert_s_tot_keys]= df[dospert_s_tot_keys].replace(['not at all risky', 'slightly risky', 'moderately risky', 'very risky', 'extremely risky'], [1,2,3,4,5])
 
 	# Check for values that don't match parameters 
-	dospert_s_check=df[dospert_s_tot_keys].apply(pd.to_numeric,args=('raise',))
-	dospert_s_check=dospert_s_check[(dospert_s_check !=1) & (dospert_s_check !=2) & (dospert_s_check !=3) & (dospert_s_check !=4) & (dospert_s_check !=5) & (dospert_s_check !=999)].sum()
-	for x in dospert_s_check:
-		if x!=0:
-			df['dospert_s_error']=np.nan
-			df.dospert_s_error=df.dospert_s_error.replace([np.nan],["Your DOSPERT(S) responses are not keyed appropriately. Please compare your data to the accepted values in the script."])
-			dospert_s_result=df['dospert_s_error']	
-		else:
-			# ------------------------------------------------------------------------------
-			# DOSPERT(S) Risktaking Score 
-
-			# Scores and questions unanswered
-			risktaking = df[risktaking_keys].apply(pd.to_numeric, args=('coerce',))
-			risktaking_socialonly_prefernotanswer = risktaking[risktaking[risktaking_keys] == 999].count(axis=1)
-			risktaking_socialonly_leftblank = risktaking.apply(lambda x: sum(x.isnull().values), axis=1)
-			risktaking_socialonly_unanswered = risktaking_socialonly_prefernotanswer + risktaking_socialonly_leftblank
-
-			# Total score
-			risktaking_socialonly_score = risktaking[risktaking[risktaking_keys] <=7].sum(axis=1)
-			risktaking_socialonly_score = risktaking_socialonly_score + (risktaking_socialonly_unanswered * risktaking_socialonly_score / (8-risktaking_socialonly_unanswered))
-
-			risktakingall = pd.DataFrame({'DOSPERT(S)_Risktaking_Left_Blank' : risktaking_socialonly_leftblank,'DOSPERT(S)_Risktaking_Prefer_Not_to_Answer': risktaking_socialonly_prefernotanswer,'DOSPERT(S)_Risktaking_Score': risktaking_socialonly_score})
-
-			# Check for scores that are outside acceptable values 
-			for x in risktaking_socialonly_score:
-				if (x<8 or x>56) and x!=np.nan:
-					risktaking_socialonly_score=risktaking_socialonly_score.replace([x],["Warning: This DOSPERT(S)_risktaking score (%d) falls outside of the accepted range (8 to 56). Please check your data and try again."  % x])
-
-
-			# ------------------------------------------------------------------------------
-			# DOSPERT(S) Riskperception Score 
-
-
-			# Scores and questions unanswered
-			riskperception = df[riskperception_keys].apply(pd.to_numeric, args=('coerce',))
-			riskperception_socialonly_prefernotanswer = riskperception[riskperception[riskperception_keys] == 999].count(axis=1)
-			riskperception_socialonly_leftblank = riskperception.apply(lambda x: sum(x.isnull().values), axis=1)
-			riskperception_socialonly_unanswered = riskperception_socialonly_prefernotanswer + riskperception_socialonly_leftblank
-
-			# Total score
-			riskperception_socialonly_score = riskperception[riskperception[riskperception_keys] <=7].sum(axis=1)
-			riskperception_socialonly_score = riskperception_socialonly_score + (riskperception_socialonly_unanswered * riskperception_socialonly_score / (8-riskperception_socialonly_unanswered))
-
-			riskperceptionall = pd.DataFrame({'DOSPERT(S)_Riskperception_Left_Blank' : riskperception_socialonly_leftblank,'DOSPERT(S)_Riskperception_Prefer_Not_to_Answer': riskperception_socialonly_prefernotanswer,'DOSPERT(S)_Riskperception_Score': riskperception_socialonly_score})
-
-			# Check for scores that are outside acceptable values 
-			for x in riskperception_socialonly_score:
-				if (x<8 or x>56) and x!=np.nan:
-					riskperception_socialonly_score=riskperception_socialonly_score.replace([x],["Warning: This DOSPERT(S)_riskperception score (%d) falls outside of the accepted range (8 to 56). Please check your data and try again."  % x])
-
-			# ------------------------------------------------------------------------------
-			# Generate Output
-
-			# Put the scores into one frame
-			dospert_s_frames = [df.SUBJECT_ID, risktakingall, riskperceptionall]
-			dospert_s_result = pd.concat(dospert_s_frames, axis=1)
+	dospert_s_check= scoring_utils.validate_items(df, dospert_s_tot_keys, [1,2,3,4,5,999])
+	if not dospert_s_check.passed:
+		df['dospert_s_error']=np.nan
+		df.dospert_s_error=df.dospert_s_error.replace([np.nan],["Your DOSPERT(S) responses are not keyed appropriately (%s). Please compare your data to the accepted values in the script." % ', '.join(dospert_s_check.offending_items)])
+		dospert_s_result=df['dospert_s_error']	
+	else:
+		# ------------------------------------------------------------------------------
+		# DOSPERT(S) Risktaking Score 
+
+		# Count the blank and "Prefer not to answer" responses of every item group in one pass
+		dospert_s_missing = scoring_utils.missing_counts(df, [
+			('risktaking', risktaking_keys),
+			('riskperception', riskperception_keys)])
+
+		# Scores and questions unanswered
+		risktaking = df[risktaking_keys].apply(pd.to_numeric, args=('coerce',))
+		risktaking_socialonly_prefernotanswer = risktaking[risktaking[risktaking_keys] == 999].count(axis=1)
+		risktaking_socialonly_leftblank = dospert_s_missing.blank['risktaking']
+		risktaking_socialonly_unanswered = risktaking_socialonly_prefernotanswer + risktaking_socialonly_leftblank
+
+		# Total score
+		risktaking_socialonly_score = risktaking[risktaking[risktaking_keys] <=7].sum(axis=1)
+		risktaking_socialonly_score = risktaking_socialonly_score + (risktaking_socialonly_unanswered * risktaking_socialonly_score / (8-risktaking_socialonly_unanswered))
+
+		# Flag scores that are outside acceptable values
+		risktaking_socialonly_score_out_of_range = scoring_utils.out_of_range(risktaking_socialonly_score, 8, 56)
+
+		risktakingall = pd.DataFrame({'DOSPERT(S)_Risktaking_Left_Blank' : risktaking_socialonly_leftblank,'DOSPERT(S)_Risktaking_Prefer_Not_to_Answer': risktaking_socialonly_prefernotanswer,'DOSPERT(S)_Risktaking_Score': risktaking_socialonly_score, 'DOSPERT(S)_Risktaking_Out_of_Range': risktaking_socialonly_score_out_of_range})
+
+
+		# ------------------------------------------------------------------------------
+		# DOSPERT(S) Riskperception Score 
+
+
+		# Scores and questions unanswered
+		riskperception = df[riskperception_keys].apply(pd.to_numeric, args=('coerce',))
+		riskperception_socialonly_prefernotanswer = riskperception[riskperception[riskperception_keys] == 999].count(axis=1)
+		riskperception_socialonly_leftblank = dospert_s_missing.blank['riskperception']
+		riskperception_socialonly_unanswered = riskperception_socialonly_prefernotanswer + riskperception_socialonly_leftblank
+
+		# Total score
+		riskperception_socialonly_score = riskperception[riskperception[riskperception_keys] <=7].sum(axis=1)
+		riskperception_socialonly_score = riskperception_socialonly_score + (riskperception_socialonly_unanswered * riskperception_socialonly_score / (8-riskperception_socialonly_unanswered))
+
+		# Flag scores that are outside acceptable values
+		riskperception_socialonly_score_out_of_range = scoring_utils.out_of_range(riskperception_socialonly_score, 8, 56)
+
+		riskperceptionall = pd.DataFrame({'DOSPERT(S)_Riskperception_Left_Blank' : riskperception_socialonly_leftblank,'DOSPERT(S)_Riskperception_Prefer_Not_to_Answer': riskperception_socialonly_prefernotanswer,'DOSPERT(S)_Riskperception_Score': riskperception_socialonly_score, 'DOSPERT(S)_Riskperception_Out_of_Range': riskperception_socialonly_score_out_of_range})
+
+		# ------------------------------------------------------------------------------
+		# Generate Output
+
+		# Put the scores into one frame
+		dospert_s_frames = [df.SUBJECT_ID, risktakingall, riskperceptionall]
+		dospert_s_result = pd.concat(dospert_s_frames, axis=1)
 	return dospert_s_result
 	#dospert_s_result.to_csv(raw_input("Save your dospert_s Output csv as: "))
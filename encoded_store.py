@@ -0,0 +1,128 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+import scoring_utils
+
+# ENCODED ITEM STORE
+
+# The cleaned responses of an export, saved as one small integer code per cell so that later runs on the
+# same export can skip parsing and cleaning the csv. Code k of a column stands for responses[column][k],
+# -1 marks a blank cell and pna[column][k] is True when that code was "Prefer not to answer".
+# Each column gets the smallest integer type its codes fit in, so a column with a response per respondent
+# (SUBJECT_ID, ResponseId, timestamps) does not widen the item columns next to it. codes holds one array per
+# type, with one row per column of that type and one code per respondent, memory-mapped when loaded; slots
+# gives the (type, row) of each column of the export.
+EncodedItems = namedtuple('EncodedItems', ['codes', 'slots', 'rows', 'columns', 'responses', 'pna'])
+
+# Integer types a column's codes are saved as, smallest first
+code_types = ['int8', 'int16', 'int32']
+
+# Changed whenever the files of a store change, so stores saved in an older layout are built again
+store_version = b'2'
+
+# ------------------------------------------------------------------------------
+# Store location
+
+# Return the SHA-1 of a file, read in blocks so large exports are not loaded at once
+def file_hash(path):
+	sha = hashlib.sha1()
+	with open(path, 'rb') as source:
+		for block in iter(lambda: source.read(1 << 20), b''):
+			sha.update(block)
+	return sha.hexdigest()
+
+# Return the folder holding the store for an export. The cleaned responses also depend on the column
+# dictionary and on how "Prefer not to answer" is written, so both are part of the key.
+def store_path(store_dir, datafilepath, headerfilepath, prefertonotanswer):
+	key = hashlib.sha1()
+	key.update(file_hash(datafilepath).encode('utf-8'))
+	key.update(file_hash(headerfilepath).encode('utf-8'))
+	key.update(prefertonotanswer.encode('utf-8'))
+	key.update(store_version)
+	return os.path.join(store_dir, key.hexdigest())
+
+# ------------------------------------------------------------------------------
+# Building and loading
+
+# Encode every column of the export, read as one or more chunks, and save the store to path.
+# The files are written to a temporary folder first, so a store that exists is always complete.
+def build_store(path, chunks, column_names, prefertonotanswer):
+	tables = [OrderedDict() for name in column_names]
+	blocks = []
+	for raw_data_frame in chunks:
+		raw_data_frame = raw_data_frame.replace([prefertonotanswer], [999])
+		block = np.empty((len(column_names), len(raw_data_frame)), dtype=np.int32)
+		for j, table in enumerate(tables):
+			codes, uniques = pd.factorize(raw_data_frame.iloc[:, j])
+			responses = scoring_utils.clean_responses(uniques)[:-1].fillna('99999')
+			pna = pd.Series(uniques, dtype=object) == 999
+			# Codes are shared by every chunk, so a response keeps its code wherever it first appears
+			mapping = [table.setdefault((response, bool(flag)), len(table)) for response, flag in zip(responses, pna)]
+			block[j] = np.array(mapping + [-1], dtype=np.int32)[codes]
+		blocks.append(block)
+
+	codes = np.concatenate(blocks, axis=1) if blocks else np.empty((len(column_names), 0), dtype=np.int32)
+	slots = []
+	groups = OrderedDict((code_type, []) for code_type in code_types)
+	for j, table in enumerate(tables):
+		code_type = next(code_type for code_type in code_types if len(table) <= np.iinfo(code_type).max)
+		slots.append((code_type, len(groups[code_type])))
+		groups[code_type].append(j)
+
+	temporary = '%s.tmp%d' % (path, os.getpid())
+	os.makedirs(temporary)
+	for code_type, positions in groups.items():
+		if positions:
+			np.save(os.path.join(temporary, 'codes_%s.npy' % code_type), codes[positions].astype(code_type))
+	with open(os.path.join(temporary, 'columns.json'), 'w') as columns_file:
+		json.dump({'columns': list(column_names), 'slots': slots, 'rows': codes.shape[1],
+			'responses': [[response for response, flag in table] for table in tables],
+			'pna': [[flag for response, flag in table] for table in tables]}, columns_file)
+	os.rename(temporary, path)
+
+# Open a saved store, memory-mapping the codes
+def load_store(path):
+	with open(os.path.join(path, 'columns.json')) as columns_file:
+		contents = json.load(columns_file)
+	slots = [tuple(slot) for slot in contents['slots']]
+	codes = OrderedDict((code_type, np.load(os.path.join(path, 'codes_%s.npy' % code_type), mmap_mode='r'))
+		for code_type in code_types if any(slot[0] == code_type for slot in slots))
+	return EncodedItems(codes, slots, contents['rows'], contents['columns'], contents['responses'], contents['pna'])
+
+# ------------------------------------------------------------------------------
+# Reading
+
+# Yield the cleaned responses and the Total_Prefer_to_Not_Answer counts of the store, chunksize rows at
+# a time (all rows if None). positions picks the columns to return, in the order of the export.
+def store_frames(store, positions=None, chunksize=None):
+	if positions is None:
+		positions = range(len(store.columns))
+	cleaned = [scoring_utils.clean_responses(store.responses[j]) for j in positions]
+	pna = [np.array(store.pna[j] + [False]) for j in positions]
+	rows = store.rows
+	step = chunksize or max(rows, 1)
+	for start in range(0, rows, step) or [0]:
+		stop = min(start + step, rows)
+		index = pd.RangeIndex(start, stop)
+		columns = []
+		total_prefernotanswer = np.zeros(stop - start, dtype=np.int64)
+		for j, position in enumerate(positions):
+			code_type, row = store.slots[position]
+			codes = np.asarray(store.codes[code_type][row, start:stop])
+			columns.append(scoring_utils.expand_codes(cleaned[j], codes, index, store.columns[position]))
+			total_prefernotanswer += pna[j][codes]
+		df = pd.concat(columns, axis=1)
+		total_prefernotanswer = pd.DataFrame({'Total_Prefer_to_Not_Answer': pd.Series(total_prefernotanswer, index=index)})
+		yield df, total_prefernotanswer
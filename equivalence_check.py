@@ -0,0 +1,189 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+import automatedreader
+import kernel_scoring
+import respondent_scoring
+import scale_registry
+import scale_specs
+import scoring_utils
+import synthetic_data
+
+# EQUIVALENCE CHECK
+
+# Scores the same synthetic export (see synthetic_data.py) with the *_analysis functions and with a faster
+# scoring engine, and reports every output column where the two disagree and how much faster the engine is.
+# A faster engine is only used once it gives the same scores, range flags and errors as the *_analysis functions.
+#
+# An engine is listed in candidate_engines with a function that scores one scale from the raw item columns
+# (as they appear in the export, before cleaning) and a function that says which scales it can score.
+
+# score(name, raw_frame, prefertonotanswer) returns the scale's output frame; supports(name) is True for the scales it scores
+Engine = namedtuple('Engine', ['score', 'supports'])
+
+# What was found for one scale: status is 'match', 'mismatch', 'skipped' or 'unsupported'; differences lists
+# (column, rows that differ, largest numeric difference, first differing pair); speedup is the legacy time over the engine time
+ScaleCheck = namedtuple('ScaleCheck', ['name', 'status', 'differences', 'legacy_seconds', 'engine_seconds', 'speedup', 'note'])
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# List all of the questionnaires to check:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+
+	# Engine to check against the *_analysis functions (one of candidate_engines):
+	engine= 'respondent_scoring'
+
+	# Synthetic export to score (see synthetic_data.py). An invalid code makes the *_analysis functions report
+	# an error for every row, while engines that score one respondent at a time only report it for that row:
+	rows= 500
+	blank_rate= 0.05
+	pna_rate= 0.05
+	invalid_rate= 0
+	seed= 0
+
+	# Number of times each scale is timed; the fastest time is kept:
+	repeats= 3
+
+	# Numbers closer than atol + rtol * |legacy score| count as the same:
+	atol= 1e-9
+	rtol= 1e-9
+
+	# Known differences that are not reported: scale -> the output columns to leave out, or ['*'] for the whole scale
+	allowlist= {}
+
+	#------------------------------------------------------------------------------------
+	checks = check_engine(candidate_engines[engine], scale_registry.selected_scales(questionnaire_list), rows, blank_rate,
+		pna_rate, invalid_rate, seed, repeats, atol, rtol, allowlist)
+	print_checks(checks)
+
+
+# ------------------------------------------------------------------------------
+# Engines
+
+# Score a scale with respondent_scoring, one respondent at a time, keeping the scores as float32
+def respondent_frame(name, raw_frame, prefertonotanswer):
+	rows = [respondent_scoring.score_respondent(name, row, prefertonotanswer) for row in raw_frame.to_dict('records')]
+	return scoring_utils.compact_scores(pd.DataFrame.from_records(rows, index=raw_frame.index))
+
+# Both engines score the scales that have a spec in scale_specs.py
+def has_spec(name):
+	return scale_specs.scale_specs.get(name) is not None
+
+candidate_engines = OrderedDict([
+	('respondent_scoring', Engine(respondent_frame, has_spec)),
+	('kernel_scoring', Engine(kernel_scoring.score_frame, has_spec)),
+])
+
+# Score a scale the way automatedreader does: clean the responses, then run its *_analysis function
+def legacy_frame(name, raw_frame, prefertonotanswer):
+	df, total_prefernotanswer = automatedreader.normalize_data_frame(raw_frame, list(raw_frame.columns), prefertonotanswer)
+	return scale_registry.score_scale(name, df)
+
+# ------------------------------------------------------------------------------
+# Comparing
+
+# Return a scale's output as a frame with each column once. The first of two same-named columns is kept,
+# as it is when the results are combined.
+def output_frame(result):
+	if isinstance(result, pd.Series):
+		result = result.to_frame()
+	return result.loc[:, ~result.columns.duplicated()]
+
+# Return the rows where two output columns differ. Numbers and range flags are compared with the tolerances,
+# anything else (error messages, SUBJECT_ID) must be the same text; blank matches blank.
+def differing_rows(expected, actual, atol, rtol):
+	left = pd.to_numeric(expected, errors='coerce').astype(float)
+	right = pd.to_numeric(actual, errors='coerce').astype(float)
+	numeric = left.notnull() & right.notnull()
+	close = numeric & ((left == right) | ((left - right).abs() <= atol + rtol * left.abs()))
+	missing = expected.isnull() & actual.isnull()
+	same_text = ~numeric & expected.notnull() & actual.notnull() & (expected.astype(str) == actual.astype(str))
+	return ~(close | missing | same_text)
+
+# Return (column, rows that differ, largest numeric difference, first differing pair) for every column
+# that differs, including columns only one of the outputs has
+def column_differences(expected, actual, atol=1e-9, rtol=1e-9, ignored=()):
+	differences = []
+	for column in list(expected.columns) + [column for column in actual.columns if column not in expected.columns]:
+		if column in ignored:
+			continue
+		if column not in actual.columns or column not in expected.columns:
+			differences.append((column, len(expected), np.nan, 'only in %s' % ('legacy' if column in expected.columns else 'engine')))
+			continue
+		rows = differing_rows(expected[column], actual[column], atol, rtol)
+		if rows.any():
+			gap = (pd.to_numeric(expected[column], errors='coerce').astype(float) - pd.to_numeric(actual[column], errors='coerce').astype(float)).abs()[rows].max()
+			first = rows.idxmax()
+			differences.append((column, int(rows.sum()), gap, '%s != %s' % (expected[column][first], actual[column][first])))
+	return differences
+
+# Call score(name, raw_frame, prefertonotanswer) repeats times and return (result or exception, fastest seconds)
+def timed_score(score, name, raw_frame, prefertonotanswer, repeats=1):
+	times = []
+	for repeat in range(repeats):
+		start = time.perf_counter()
+		try:
+			result = score(name, raw_frame.copy(), prefertonotanswer)
+		except Exception as error:
+			result = error
+		times.append(time.perf_counter() - start)
+	return result, min(times)
+
+# Check one scale. Both outputs must match column for column, or both must raise the same exception.
+def check_scale(engine, name, raw_frame, prefertonotanswer="Prefer not to answer", repeats=1, atol=1e-9, rtol=1e-9, allowlist=None):
+	ignored = (allowlist or {}).get(name, [])
+	if '*' in ignored:
+		return ScaleCheck(name, 'skipped', [], np.nan, np.nan, np.nan, 'on the allowlist')
+	if not engine.supports(name):
+		return ScaleCheck(name, 'unsupported', [], np.nan, np.nan, np.nan, 'the engine cannot score this scale')
+	expected, legacy_seconds = timed_score(legacy_frame, name, raw_frame, prefertonotanswer, repeats)
+	actual, engine_seconds = timed_score(engine.score, name, raw_frame, prefertonotanswer, repeats)
+	speedup = legacy_seconds / engine_seconds if engine_seconds else np.inf
+	if isinstance(expected, Exception) or isinstance(actual, Exception):
+		same = type(expected) is type(actual)
+		note = 'legacy: %s, engine: %s' % (type(expected).__name__, type(actual).__name__)
+		return ScaleCheck(name, 'match' if same else 'mismatch', [], legacy_seconds, engine_seconds, speedup, note)
+	differences = column_differences(output_frame(expected), output_frame(actual), atol, rtol, ignored)
+	return ScaleCheck(name, 'mismatch' if differences else 'match', differences, legacy_seconds, engine_seconds, speedup, '')
+
+# Check an engine against the *_analysis functions on one synthetic export of the named scales
+def check_engine(engine, names, rows=500, blank_rate=0.05, pna_rate=0.05, invalid_rate=0, seed=0, repeats=1, atol=1e-9,
+		rtol=1e-9, allowlist=None, prefertonotanswer="Prefer not to answer"):
+	raw_frame = synthetic_data.synthetic_frame(names, rows, blank_rate, pna_rate, invalid_rate, prefertonotanswer, seed)
+	return [check_scale(engine, name, raw_frame[scale_registry.scale_columns(name)], prefertonotanswer, repeats, atol, rtol, allowlist)
+		for name in names]
+
+# ------------------------------------------------------------------------------
+# Output
+
+# Print one line per scale, then every column that differs
+def print_checks(checks):
+	print("%-12s %-12s %12s %12s %9s  %s" % ('Scale', 'Status', 'Legacy (s)', 'Engine (s)', 'Speed-up', 'Note'))
+	for check in checks:
+		print("%-12s %-12s %12.4f %12.4f %9.1f  %s" % (check.name, check.status, check.legacy_seconds, check.engine_seconds, check.speedup, check.note))
+		for column, count, gap, example in check.differences:
+			print("    %-48s %6d rows  largest difference %-10.4g %s" % (column, count, gap, example))
+	mismatches = [check.name for check in checks if check.status == 'mismatch']
+	if mismatches:
+		print("The engine does not match the *_analysis functions for: %s" % ', '.join(mismatches))
+	else:
+		print("The engine matches the *_analysis functions on every scale it scores")
+
+
+if __name__ == '__main__':
+	main()
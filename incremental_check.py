@@ -0,0 +1,149 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import filecmp
+import os
+
+import numpy as np
+
+import automatedreader
+import incremental_scoring
+import scale_registry
+import synthetic_data
+
+# INCREMENTAL CHECK
+
+# Scores a synthetic export (see synthetic_data.py) incrementally and in full, and checks that the two give
+# the same files byte for byte. The export is scored once with incremental set, then grown by added_rows
+# new respondents and edited in changed_rows of the old ones, and scored incrementally again: that output
+# mixes rows kept from the first run with rows scored again. A full run on the grown export must give the
+# same output, range report and list of responses that are not accepted.
+
+# The files written next to an output (see automatedreader.score_export), compared along with it
+output_suffixes = ['', '.range_warnings.csv', '.violations.csv']
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# Folder the synthetic export and the outputs are written to (made if it does not exist):
+	folder= '/Users/ra1/incremental_check'
+
+	# List all of the questionnaires to check:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PSS,SAQ-A,STAI'
+
+	# Respondents of the first export, respondents added to it and old respondents whose answers are changed:
+	rows= 500
+	added_rows= 100
+	changed_rows= 50
+
+	# Synthetic answers (see synthetic_data.py). Leave invalid_rate at 0 unless score_clean_rows is set: otherwise
+	# a response that is not accepted turns its scale into the error column for every row scored with it, and
+	# an incremental run scores different rows together than a full run does:
+	blank_rate= 0.05
+	pna_rate= 0.05
+	invalid_rate= 0
+	seed= 0
+
+	# Settings passed on to automatedreader.score_export for every run (see automatedreader.main):
+	export_settings= {'max_workers': None, 'chunksize': None, 'score_from_codes': True, 'score_clean_rows': False}
+
+	#------------------------------------------------------------------------------------
+	differences = check_incremental(folder, questionnaire_list, rows, added_rows, changed_rows, blank_rate, pna_rate,
+		invalid_rate, seed, export_settings)
+	print_differences(differences)
+
+
+# ------------------------------------------------------------------------------
+# Checking
+
+# Return the synthetic export before and after it grows: the first rows respondents, then the same
+# respondents with changed_rows of them answering differently, followed by added_rows new ones
+def grown_exports(names, rows, added_rows, changed_rows, blank_rate=0.05, pna_rate=0.05, invalid_rate=0,
+		prefertonotanswer="Prefer not to answer", seed=0):
+	grown = synthetic_data.synthetic_frame(names, rows + added_rows, blank_rate, pna_rate, invalid_rate, prefertonotanswer, seed)
+	first = grown.iloc[:rows].copy()
+	edits = synthetic_data.synthetic_frame(names, rows, blank_rate, pna_rate, invalid_rate, prefertonotanswer, seed + 1)
+	changed = np.random.default_rng(seed).choice(rows, changed_rows, replace=False)
+	items = [column for column in grown.columns if column != 'SUBJECT_ID']
+	grown.loc[changed, items] = edits.loc[changed, items]
+	return first, grown
+
+# Score the grown export incrementally after its first version, and in full, and return the differences
+# between the two (see file_differences)
+def check_incremental(folder, questionnaire_list, rows=500, added_rows=100, changed_rows=50, blank_rate=0.05, pna_rate=0.05,
+		invalid_rate=0, seed=0, export_settings=None, prefertonotanswer="Prefer not to answer"):
+	if export_settings is None:
+		export_settings = {}
+	if not os.path.isdir(folder):
+		os.makedirs(folder)
+	datafilepath = os.path.join(folder, 'export.csv')
+	headerfilepath = os.path.join(folder, 'columndictionary.csv')
+	incremental_output = os.path.join(folder, 'incremental_output.csv')
+	full_output = os.path.join(folder, 'full_output.csv')
+
+	# Start without the outputs of an earlier check, so the first run scores every respondent
+	for path in [incremental_output + suffix for suffix in output_suffixes] + [incremental_scoring.fingerprint_path(incremental_output)]:
+		if os.path.exists(path):
+			os.remove(path)
+
+	first, grown = grown_exports(scale_registry.selected_scales(questionnaire_list), rows, added_rows, changed_rows, blank_rate,
+		pna_rate, invalid_rate, prefertonotanswer, seed)
+	synthetic_data.save_export(first, datafilepath, headerfilepath)
+	automatedreader.score_export(datafilepath, headerfilepath, questionnaire_list, incremental_output, prefertonotanswer,
+		incremental=True, **export_settings)
+	synthetic_data.save_export(grown, datafilepath, headerfilepath)
+	automatedreader.score_export(datafilepath, headerfilepath, questionnaire_list, incremental_output, prefertonotanswer,
+		incremental=True, **export_settings)
+	automatedreader.score_export(datafilepath, headerfilepath, questionnaire_list, full_output, prefertonotanswer,
+		incremental=False, **export_settings)
+	return file_differences(incremental_output, full_output)
+
+# Return (file of the incremental run, line number, incremental line, full line) for the first differing
+# line of each file that is not the same as the full run's
+def file_differences(incremental_output, full_output):
+	differences = []
+	for suffix in output_suffixes:
+		incremental_path = incremental_output + suffix
+		full_path = full_output + suffix
+		if not os.path.exists(incremental_path) and not os.path.exists(full_path):
+			continue
+		if not os.path.exists(incremental_path) or not os.path.exists(full_path):
+			differences.append((incremental_path, 0, 'exists' if os.path.exists(incremental_path) else 'missing',
+				'exists' if os.path.exists(full_path) else 'missing'))
+			continue
+		if filecmp.cmp(incremental_path, full_path, shallow=False):
+			continue
+		with open(incremental_path) as incremental_file, open(full_path) as full_file:
+			incremental_lines = incremental_file.read().splitlines()
+			full_lines = full_file.read().splitlines()
+		line = next((i for i, (left, right) in enumerate(zip(incremental_lines, full_lines)) if left != right),
+			min(len(incremental_lines), len(full_lines)))
+		differences.append((incremental_path, line + 1, incremental_lines[line] if line < len(incremental_lines) else '',
+			full_lines[line] if line < len(full_lines) else ''))
+	return differences
+
+# ------------------------------------------------------------------------------
+# Output
+
+# Print the first differing line of each file, or that the incremental run matches the full run
+def print_differences(differences):
+	for path, line, incremental_line, full_line in differences:
+		print("%s differs from the full run at line %d" % (path, line))
+		print("    incremental: %s" % incremental_line[:200])
+		print("    full:        %s" % full_line[:200])
+	if differences:
+		print("The incremental run does not match the full run")
+	else:
+		print("The incremental run matches the full run")
+
+
+if __name__ == '__main__':
+	main()
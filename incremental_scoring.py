@@ -0,0 +1,85 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import hashlib
+import inspect
+import os
+
+import pandas as pd
+
+import encoded_store
+import item_codes
+import kernel_scoring
+import respondent_scoring
+import scale_registry
+import scale_specs
+import scoring_utils
+
+# INCREMENTAL SCORING
+
+# A fingerprint of every respondent's responses is saved next to the output file. On the next run only
+# respondents whose fingerprint is new are scored; everyone else keeps the row from the previous output.
+
+# ------------------------------------------------------------------------------
+# Fingerprints
+
+# Return the file the fingerprints of output_name are saved in
+def fingerprint_path(output_name):
+	return output_name + '.fingerprints'
+
+# Return a key covering everything besides the responses that the scores depend on: the selected
+# questionnaires, how "Prefer not to answer" is written and the scoring scripts themselves, with the
+# shared helpers that shape their output, the item lists in scale_specs and the modules that score item
+# codes, and whether score_clean_rows is set. Changing any of these changes every fingerprint, so every
+# respondent is scored again.
+def settings_key(questionnaire_list, prefertonotanswer, score_clean_rows=False):
+	key = hashlib.sha1()
+	key.update(questionnaire_list.encode('utf-8'))
+	key.update(prefertonotanswer.encode('utf-8'))
+	if score_clean_rows:
+		key.update(b'score_clean_rows')
+	for module in (scale_registry, scale_specs, scoring_utils, item_codes, kernel_scoring, respondent_scoring):
+		key.update(encoded_store.file_hash(inspect.getsourcefile(module)).encode('utf-8'))
+	for name in scale_registry.selected_scales(questionnaire_list):
+		key.update(encoded_store.file_hash(inspect.getsourcefile(scale_registry.scale_analysis(name))).encode('utf-8'))
+	return key.hexdigest()[:16]
+
+# Return the fingerprint of each row: a hash of its cleaned responses and Total_Prefer_to_Not_Answer count
+def row_fingerprints(df, total_prefernotanswer, key):
+	rows = pd.concat([df, total_prefernotanswer], axis=1)
+	return ['%016x' % fingerprint for fingerprint in pd.util.hash_pandas_object(rows, index=False, hash_key=key)]
+
+# ------------------------------------------------------------------------------
+# Previous output
+
+# Read the previous output and its fingerprints. Returns None when there is no previous run to build on.
+# Otherwise returns the output and a dict from (SUBJECT_ID, fingerprint) to the row holding those scores.
+def load_previous(output_name):
+	if not (os.path.exists(output_name) and os.path.exists(fingerprint_path(output_name))):
+		return None
+	# The scores were written from float32, so they are read back as float32 and are written again unchanged.
+	# SUBJECT_ID stays text, so an ID such as 007 keeps its zeros.
+	output = scoring_utils.compact_scores(pd.read_csv(output_name, index_col=0, float_precision='round_trip', dtype={'SUBJECT_ID': str}))
+	fingerprints = pd.read_csv(fingerprint_path(output_name), dtype=str, keep_default_na=False)
+	if len(output) != len(fingerprints):
+		return None
+	rows = dict((key, row) for row, key in enumerate(zip(fingerprints['SUBJECT_ID'], fingerprints['Fingerprint'])))
+	return output, rows
+
+# Return the previous output rows of the respondents whose responses have not changed, indexed like subject_ids
+def previous_rows(previous, subject_ids, fingerprints):
+	output, rows = previous
+	found = [(i, rows[key]) for i, key in enumerate(zip(subject_ids, fingerprints)) if key in rows]
+	unchanged = output.iloc[[row for i, row in found]]
+	unchanged.index = subject_ids.index[[i for i, row in found]]
+	return unchanged
+
+# Save the fingerprints of the rows just written to output_name, in the same order
+def save_fingerprints(output_name, subject_ids, fingerprints):
+	temporary = fingerprint_path(output_name) + '.tmp'
+	pd.DataFrame({'SUBJECT_ID': subject_ids, 'Fingerprint': fingerprints}).to_csv(temporary, index=False)
+	os.replace(temporary, fingerprint_path(output_name))
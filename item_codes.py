@@ -0,0 +1,174 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+import respondent_scoring
+import scale_specs
+
+# ITEM CODES
+
+# Holds the items of a battery as one int8 code per cell instead of a text response per cell: about one
+# byte a cell, so 100,000 respondents by 1,000 items take 100 MB. Each response is cleaned and turned into
+# the number its scale scores it as (see respondent_scoring.py), then stored as that code. Three codes are
+# set aside: BLANK for a blank cell, PREFER_NOT_TO_ANSWER for "Prefer not to answer" (999) and INVALID for
+# a response its scale does not accept, which makes that scale report its error column instead of scores.
+# A response that is neither a label nor a number (such as "banana") is INVALID too, and listed by
+# violation_table like any other; the *_analysis functions and respondent_scoring raise a ValueError instead.
+#
+# Every scale has a spec in scale_specs.py giving its labels and accepted codes, and the accepted codes
+# other than 999 must lie between 0 and 127.
+
+BLANK = -1
+PREFER_NOT_TO_ANSWER = -2
+INVALID = -3
+
+# codes holds one row per respondent and one column per item of columns; scales maps each scale to its
+# ScaleItems; invalid maps each item with INVALID codes to the rows (by position) holding them and the
+# responses they hold, as they appear in the export; index is the index of the rows and subject_ids the
+# cleaned SUBJECT_ID of each row (None when the export had no SUBJECT_ID column)
+ItemCodes = namedtuple('ItemCodes', ['codes', 'columns', 'scales', 'invalid', 'index', 'subject_ids'])
+
+# The items of one scale: its spec, and the column of codes holding each item of spec.keys
+ScaleItems = namedtuple('ScaleItems', ['spec', 'positions'])
+
+# The columns of violation_table
+violation_columns = ['row', 'SUBJECT_ID', 'scale', 'item', 'response']
+
+# ------------------------------------------------------------------------------
+# Encoding
+
+# Return the number a response stands for, or inf (which no scale accepts) when it is neither a label
+# nor a number
+def response_code_number(value, labels, prefertonotanswer):
+	try:
+		return respondent_scoring.response_number(respondent_scoring.clean_response(value, prefertonotanswer), labels)
+	except ValueError:
+		return np.inf
+
+# Return a column of responses as int8 codes, and the (rows, responses) of its INVALID codes. Each distinct
+# response is cleaned, turned into its number and checked against the accepted codes once, and the codes
+# are spread back over the rows.
+def encode_column(column, labels, accepted, prefertonotanswer):
+	codes, uniques = pd.factorize(column)
+	numbers = np.array([response_code_number(value, labels, prefertonotanswer) for value in uniques] + [np.nan], dtype=float)
+	table = np.full(len(numbers), INVALID, dtype=np.int8)
+	valid = np.isin(numbers, accepted)
+	table[valid] = numbers[valid]
+	table[numbers == 999] = PREFER_NOT_TO_ANSWER
+	table[np.isnan(numbers)] = BLANK
+	rows = np.flatnonzero(np.isin(codes, np.flatnonzero(table == INVALID)))
+	return table[codes], (rows, np.asarray(uniques, dtype=object)[codes[rows]])
+
+# Return the scales of names that have a spec, and so can be stored as item codes
+def coded_scales(names):
+	return [name for name in names if scale_specs.scale_specs.get(name) is not None]
+
+# Return the items of the named scales, each once, mapped to the (labels, accepted codes) it is read with,
+# and the ScaleItems of each scale
+def scale_items(names):
+	columns = OrderedDict()
+	scales = OrderedDict()
+	for name in names:
+		spec = respondent_scoring.scale_spec(name)
+		accepted = [code for code in spec.accepted if code != 999]
+		if min(accepted) < 0 or max(accepted) > 127:
+			raise ValueError("%s accepts codes outside 0 to 127, which cannot be stored as item codes" % name)
+		for key in spec.keys:
+			columns.setdefault(key, (spec.labels, accepted))
+		scales[name] = ScaleItems(spec, np.array([list(columns).index(key) for key in spec.keys], dtype=np.intp))
+	return columns, scales
+
+# Encode the items of the named scales, given as they appear in the export (or as cleaned by
+# automatedreader.normalize_data_frame). An item that is part of two scales is stored once.
+def encode_items(names, raw_frame, prefertonotanswer="Prefer not to answer"):
+	columns, scales = scale_items(names)
+
+	codes = np.empty((len(raw_frame), len(columns)), dtype=np.int8)
+	invalid = OrderedDict()
+	for j, (key, (labels, accepted)) in enumerate(columns.items()):
+		codes[:, j], responses = encode_column(raw_frame[key], labels, accepted, prefertonotanswer)
+		if len(responses[0]):
+			invalid[key] = responses
+	subject_ids = None
+	if 'SUBJECT_ID' in raw_frame.columns:
+		subject_ids = np.array([respondent_scoring.clean_response(value, prefertonotanswer) for value in raw_frame['SUBJECT_ID']],
+			dtype=object)
+	return ItemCodes(codes, list(columns), scales, invalid, raw_frame.index, subject_ids)
+
+# Return the item codes as a data frame with one int8 column per item, in the order of item_codes.columns
+def code_frame(item_codes):
+	return pd.DataFrame(item_codes.codes, columns=item_codes.columns, index=item_codes.index)
+
+# Return whether a data frame holds the items of a scale as int8 item codes (see code_frame)
+def holds_codes(frame, name):
+	spec = scale_specs.scale_specs.get(name)
+	return spec is not None and all(key in frame.columns and frame[key].dtype == np.int8 for key in spec.keys)
+
+# Return the item codes of the named scales held in a data frame (see code_frame). Its SUBJECT_ID
+# column, when it has one, must already be cleaned. The responses behind INVALID codes are not known.
+def frame_codes(frame, names):
+	columns, scales = scale_items(names)
+	subject_ids = frame['SUBJECT_ID'].to_numpy(dtype=object) if 'SUBJECT_ID' in frame.columns else None
+	return ItemCodes(frame[list(columns)].to_numpy(dtype=np.int8), list(columns), scales, OrderedDict(), frame.index, subject_ids)
+
+# ------------------------------------------------------------------------------
+# Reading
+
+# Return the items of one scale as a float32 matrix: one column per item of its spec.keys, NaN for
+# blank cells and 999 for "Prefer not to answer"
+def scale_values(item_codes, name):
+	codes = item_codes.codes[:, item_codes.scales[name].positions]
+	values = codes.astype(np.float32)
+	values[codes == BLANK] = np.nan
+	values[codes == PREFER_NOT_TO_ANSWER] = 999
+	return values
+
+# Return which responses of a scale it does not accept, as a boolean matrix like scale_values
+def invalid_cells(item_codes, name):
+	return item_codes.codes[:, item_codes.scales[name].positions] == INVALID
+
+# Return the items of a scale holding at least one response the scale does not accept
+def offending_items(item_codes, name):
+	scale = item_codes.scales[name]
+	return [key for key, offending in zip(scale.spec.keys, invalid_cells(item_codes, name).any(axis=0)) if offending]
+
+# Return every response of a scale it does not accept, as (row, item, response) in row order, where
+# row is the index label of the row and response is as it appears in the export
+def violations(item_codes, name):
+	found = []
+	for j, key in enumerate(item_codes.scales[name].spec.keys):
+		rows, responses = item_codes.invalid.get(key, ((), ()))
+		found += [(row, j, key, response) for row, response in zip(rows, responses)]
+	return [(item_codes.index[row], key, response) for row, j, key, response in sorted(found, key=lambda cell: cell[:2])]
+
+# Return every response the scales do not accept (see violations) as a data frame with one row per response:
+# the row of the export it is on, that row's SUBJECT_ID, the scale, the item and the response
+def violation_table(item_codes):
+	rows = []
+	for name in item_codes.scales:
+		for row, key, response in violations(item_codes, name):
+			subject_id = None if item_codes.subject_ids is None else item_codes.subject_ids[item_codes.index.get_loc(row)]
+			rows.append(OrderedDict(zip(violation_columns, (row, subject_id, name, key, response))))
+	return pd.DataFrame(rows, columns=violation_columns)
+
+# Return one row per item of each scale: the scale, the item, its column of codes, the codes it accepts
+# and how many of its responses are blank, "Prefer not to answer" and not accepted
+def metadata_table(item_codes):
+	rows = []
+	for name, scale in item_codes.scales.items():
+		codes = item_codes.codes[:, scale.positions]
+		for j, key in enumerate(scale.spec.keys):
+			rows.append(OrderedDict([('scale', name), ('item', key), ('position', scale.positions[j]),
+				('accepted', ' '.join(str(code) for code in scale.spec.accepted)),
+				('blank', int((codes[:, j] == BLANK).sum())),
+				('prefer_not_to_answer', int((codes[:, j] == PREFER_NOT_TO_ANSWER).sum())),
+				('invalid', int((codes[:, j] == INVALID).sum()))]))
+	return pd.DataFrame(rows, columns=['scale', 'item', 'position', 'accepted', 'blank', 'prefer_not_to_answer', 'invalid'])
@@ -0,0 +1,229 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import functools
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+import item_codes
+import respondent_scoring
+
+# KERNEL SCORING
+
+# Scores a whole export one scale at a time from its spec in scale_specs.py. Each spec is compiled once
+# into a kernel: a weight matrix from the items of the scale to its item groups. The scale's items are
+# read from the int8 item codes of the battery (see item_codes.py) into one matrix of numbers (one row
+# per respondent, NaN for blank cells, 999 for "Prefer not to answer"), and the sums, counted items,
+# blank and "Prefer not to answer" counts of every item group of every subscale come from a single
+# product of that matrix, masked and in float32, with the weights. The subscale rules, totals and range
+# checks then work on whole columns of scores.
+#
+# automatedreader scores the selected scales that have a spec this way when score_from_codes is set: their
+# items are kept as item codes (see automatedreader.coded_data_frame), scale_registry.score_scale hands
+# them to score_codes, and the workers of the scoring pool compile the kernels as they start.
+#
+# The output is the same as the scale's *_analysis function gives for the same rows: the same error
+# column when validation fails, the same float32 scores and range flags and the same exceptions. Like the *_analysis
+# functions, one response that is not accepted turns the whole scale into its error column.
+
+# The weights map four blocks of features, one row per respondent, to four blocks of group columns:
+#	each cell's code where it counts (0 where not)	-> the group sums, weighted by +1 or -1 for reverse items
+#	whether each cell counts (1 or 0)		-> the group sums, weighted by the reverse constant,
+#							   and the number of items of each group that count
+#	whether each item is blank			-> the blank count of each group
+#	whether each item is 999			-> the "Prefer not to answer" count of each group
+# A cell is an item read with the bounds one of its groups gives it, so a reverse item is (constant - code).
+# Sums and counts are whole numbers well below 2**24, so float32 gives them exactly.
+
+# spec is the scale's spec; cell_items, cell_low and cell_high give the item column and bounds of each cell;
+# weights is the float32 weight matrix; sizes and skipna give the number of items of each group and whether
+# its sum survives an item that does not count; subscale_groups lists the groups of each subscale. For the
+# 'impute' rule, group g also lists its items, in order, from starts[g] to ends[g] of items, low and high.
+Kernel = namedtuple('Kernel', ['spec', 'cell_items', 'cell_low', 'cell_high', 'weights', 'sizes', 'skipna', 'subscale_groups',
+	'items', 'low', 'high', 'starts', 'ends'])
+
+# ------------------------------------------------------------------------------
+# Compiling
+
+# Compile the spec of a scale into its kernel. Kernels are kept, so each scale is compiled once.
+@functools.lru_cache(maxsize=None)
+def compile_kernel(name):
+	spec = respondent_scoring.scale_spec(name)
+	cells = OrderedDict()
+	entries = []
+	items, low, high = [], [], []
+	starts, ends, skipna, subscale_groups = [], [], [], []
+	for subscale in spec.subscales:
+		groups = []
+		for group in subscale.groups:
+			groups.append(len(starts))
+			starts.append(len(items))
+			skipna.append(group.skipna)
+			for key in group.keys:
+				item = spec.keys.index(key)
+				bounds = (-np.inf if group.low is None else group.low, np.inf if group.high is None else group.high)
+				cell = cells.setdefault((item,) + bounds, len(cells))
+				entries.append((len(starts) - 1, cell, item, 0 if group.reverse is None else group.reverse,
+					1 if group.reverse is None else -1))
+				items.append(item)
+				low.append(bounds[0])
+				high.append(bounds[1])
+			ends.append(len(items))
+		subscale_groups.append(groups)
+
+	n_cells, n_keys, n_groups = len(cells), len(spec.keys), len(starts)
+	weights = np.zeros((2 * n_cells + 2 * n_keys, 4 * n_groups), dtype=np.float32)
+	for group, cell, item, constant, sign in entries:
+		weights[cell, group] += sign
+		weights[n_cells + cell, group] += constant
+		weights[n_cells + cell, n_groups + group] += 1
+		weights[2 * n_cells + item, 2 * n_groups + group] += 1
+		weights[2 * n_cells + n_keys + item, 3 * n_groups + group] += 1
+	cell_items, cell_low, cell_high = [np.array(column) for column in zip(*cells)]
+	starts, ends = np.array(starts, dtype=np.intp), np.array(ends, dtype=np.intp)
+	return Kernel(spec, cell_items.astype(np.intp), cell_low.astype(float), cell_high.astype(float), weights, ends - starts,
+		np.array(skipna), subscale_groups, np.array(items, dtype=np.intp), np.array(low, dtype=float), np.array(high, dtype=float),
+		starts, ends)
+
+# ------------------------------------------------------------------------------
+# Arithmetic
+
+# Flag the scores of a column that fail a range check. Blank scores and scores without a check are not flagged.
+def out_of_range(score, check):
+	if check is None:
+		return np.zeros(len(score), dtype=bool)
+	return (score < check.low) | (score > check.high)
+
+# ------------------------------------------------------------------------------
+# Scoring
+
+# Score every subscale and total of a scale from its item matrix. Returns an OrderedDict from each
+# subscale and total to its (left blank, prefer not to answer, unanswered, score, out of range) columns.
+# A subscale whose check has no column of its own flags the totals built on it instead.
+def run_kernel(kernel, items):
+	spec = kernel.spec
+	values = items[:, kernel.cell_items]
+	with np.errstate(invalid='ignore'):
+		counted = (values >= kernel.cell_low) & (values <= kernel.cell_high)
+	n_cells, n_keys, n_groups = len(kernel.cell_items), len(spec.keys), len(kernel.sizes)
+	features = np.empty((len(items), 2 * n_cells + 2 * n_keys), dtype=np.float32)
+	features[:, :n_cells] = np.where(counted, values, 0)
+	features[:, n_cells:2 * n_cells] = counted
+	features[:, 2 * n_cells:2 * n_cells + n_keys] = np.isnan(items)
+	features[:, 2 * n_cells + n_keys:] = items == 999
+	sums = features @ kernel.weights
+	group_scores = sums[:, :n_groups].astype(float)
+	group_scores[~kernel.skipna & (sums[:, n_groups:2 * n_groups] != kernel.sizes)] = np.nan
+	group_blank = sums[:, 2 * n_groups:3 * n_groups].astype(np.int64)
+	group_prefernotanswer = sums[:, 3 * n_groups:].astype(np.int64)
+
+	results = OrderedDict()
+	subscales = dict((subscale.name, subscale) for subscale in spec.subscales)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		for subscale, groups in zip(spec.subscales, kernel.subscale_groups):
+			leftblank = group_blank[:, groups].sum(axis=1)
+			prefernotanswer_count = group_prefernotanswer[:, groups].sum(axis=1)
+			score = group_scores[:, groups[0]]
+			for group in groups[1:]:
+				score = score + group_scores[:, group]
+			if subscale.blank_is_pna:
+				leftblank = prefernotanswer_count
+			unanswered = leftblank + prefernotanswer_count
+			if subscale.zero_to_nan:
+				score = np.where(score == 0, np.nan, score)
+			if subscale.rule == 'prorate':
+				score = score + unanswered * score / (subscale.n - unanswered)
+			elif subscale.rule == 'mean':
+				score = score / (subscale.n - unanswered)
+			elif subscale.rule == 'impute':
+				score = imputed_sums(kernel, items, groups, score / (subscale.n - unanswered))
+			results[subscale.name] = (leftblank, prefernotanswer_count, unanswered, score, out_of_range(score, subscale.check))
+
+		for total in spec.totals:
+			parts = [results[name] for name in total.parts]
+			leftblank = sum(part[0] for part in parts)
+			prefernotanswer_count = sum(part[1] for part in parts)
+			unanswered = sum(part[2] for part in parts)
+			if total.rule == 'weighted_mean':
+				weighted = [part[3] * (subscales[name].n - part[2]) for name, part in zip(total.parts, parts)]
+				score = sum(weighted[1:], weighted[0]) / (total.n - prefernotanswer_count)
+			else:
+				score = sum((part[3] for part in parts[1:]), parts[0][3])
+			flagged = out_of_range(score, total.check)
+			for name, part in zip(total.parts, parts):
+				if subscales[name].check is not None and subscales[name].check.column is None:
+					flagged = flagged | part[4]
+			results[total.name] = (leftblank, prefernotanswer_count, unanswered, score, flagged)
+	return results
+
+# Sum the items of an 'impute' subscale again, with every unanswered item replaced by the row's average
+def imputed_sums(kernel, items, groups, average):
+	score = np.zeros(len(items))
+	for group in groups:
+		start, end = kernel.starts[group], kernel.ends[group]
+		group_values = items[:, kernel.items[start:end]]
+		group_values = np.where(np.isnan(group_values) | (group_values == 999), average[:, None], group_values)
+		with np.errstate(invalid='ignore'):
+			counted = (group_values >= kernel.low[start:end]) & (group_values <= kernel.high[start:end])
+		score = score + np.where(counted, group_values, 0).sum(axis=1)
+	return score
+
+# Return the output columns of a scale, scored by run_kernel, as a data frame with float32 scores
+def output_frame(spec, results, subject_ids, index):
+	blocks = dict((subscale.name, subscale) for subscale in spec.subscales)
+	blocks.update((total.name, total) for total in spec.totals)
+	scores = OrderedDict()
+	if spec.subject_id:
+		scores['SUBJECT_ID'] = subject_ids
+	for name in spec.outputs:
+		leftblank, prefernotanswer, unanswered, score, flagged = results[name]
+		for column, value in zip(blocks[name].columns, (leftblank, prefernotanswer, score.astype(np.float32))):
+			if column is not None:
+				scores[column] = value
+		check = blocks[name].check
+		if check is not None and check.column is not None:
+			scores[check.column] = flagged
+	return pd.DataFrame(scores, index=index)
+
+# Score one scale from the item codes of a battery (see item_codes.py) and return its output columns as a
+# data frame. When the scale has responses it does not accept, the output is its error column, as with its
+# *_analysis function; with score_clean_rows the rows without such responses are scored instead, and the
+# error column is always added (so every chunk of an export has the same columns), giving the offending items
+# of each other row.
+def score_codes(name, codes, score_clean_rows=False):
+	kernel = compile_kernel(name)
+	spec = kernel.spec
+	message = "Your %s responses are not keyed appropriately (%s). Please compare your data to the accepted values in the script."
+
+	# Check for values that don't match parameters
+	invalid = item_codes.invalid_cells(codes, name)
+	offending = invalid.any(axis=1)
+	if not offending.any() and not score_clean_rows:
+		return output_frame(spec, run_kernel(kernel, item_codes.scale_values(codes, name)), codes.subject_ids, codes.index)
+	if not score_clean_rows:
+		return pd.DataFrame({spec.error_column: message % (spec.error_label, ', '.join(item_codes.offending_items(codes, name)))},
+			index=codes.index)
+
+	clean = ~offending
+	subject_ids = None if codes.subject_ids is None else codes.subject_ids[clean]
+	scores = output_frame(spec, run_kernel(kernel, item_codes.scale_values(codes, name)[clean]), subject_ids, codes.index[clean])
+	# The counts are kept as float32 like the scores, so they can be blank for the rows that are not scored
+	# in every chunk alike (and read back the same by incremental_scoring.load_previous)
+	scores = scores.astype({column: np.float32 for column in scores.columns if scores[column].dtype == np.int64}).reindex(codes.index)
+	if spec.subject_id:
+		scores['SUBJECT_ID'] = codes.subject_ids
+	errors = np.full(len(codes.index), np.nan, dtype=object)
+	for row in np.flatnonzero(offending):
+		errors[row] = message % (spec.error_label, ', '.join(key for key, bad in zip(spec.keys, invalid[row]) if bad))
+	scores[spec.error_column] = errors
+	return scores
+
+# Score one scale of an export, given its item columns (and SUBJECT_ID) as they appear in the export
+def score_frame(name, raw_frame, prefertonotanswer="Prefer not to answer"):
+	return score_codes(name, item_codes.encode_items([name], raw_frame, prefertonotanswer))
@@ -9,6 +9,7 @@ Battery Scores Package for Processing Qualtrics CSV Files
 """
 import pandas as pd
 import numpy as np
+import scoring_utils
 import sys 
 
 # Positive and Negative Affect Schedule 
@@ -30,77 +31,77 @@ Scoring:https://yale.box.com/s/13io2yje4trm5ode8acw6wsk0ip4ij25
 # ------------------------------------------------------------------------------
 # Data Preparation 
 
-def panas_analysis(df):
-	# THESE KEYS ARE READ BY THE COLUMN DICTIONARY -> Question_Name
-	panas_zero= ['panas_0']
-	panas_positive_keys = ['panas_1', 'panas_3', 'panas_5', 'panas_9','panas_10', 'panas_12', 'panas_14', 'panas_16','panas_17', 'panas_19']
-	panas_negative_keys = ['panas_2', 'panas_4', 'panas_6', 'panas_7','panas_8', 'panas_11', 'panas_13', 'panas_15','panas_18', 'panas_20']
+# THESE KEYS ARE READ BY THE COLUMN DICTIONARY -> Question_Name
+panas_zero= ['panas_0']
+panas_positive_keys = ['panas_1', 'panas_3', 'panas_5', 'panas_9','panas_10', 'panas_12', 'panas_14', 'panas_16','panas_17', 'panas_19']
+panas_negative_keys = ['panas_2', 'panas_4', 'panas_6', 'panas_7','panas_8', 'panas_11', 'panas_13', 'panas_15','panas_18', 'panas_20']
 
-	panas_tot_keys= panas_positive_keys+panas_negative_keys+panas_zero
+panas_tot_keys= panas_positive_keys+panas_negative_keys+panas_zero
 
+def panas_analysis(df):
 	# Replace Qualtrics text answers with numerical values
 	panas_zero
 	df[panas_tot_keys]= df[panas_tot_keys].replace(['1', '2', 'very slightly or not at all', 'a little',  'moderately', 'quite a bit','extremely'], ["at_present","past_week",1,2,3,4,5])
 
 	# Check for values that fall outside parameter ranges
-	panas_check=df[panas_tot_keys].apply(pd.to_numeric,args=('raise',))
-	panas_check=panas_check[(panas_check !=1) & (panas_check !=2) & (panas_check !=3) & (panas_check !=4) & (panas_check !=5) & (panas_check !=999)].sum()
-	for x in panas_check:
-		if x!=0:
-			df['panas_error']=np.nan
-			df.panas_error=df.panas_error.replace([np.nan],["Your PANAS responses are not keyed appropriately. Please compare your data to the accepted values in the script."])
-			panas_result=df['panas_error']
-
-		else:
+	panas_check= scoring_utils.validate_items(df, panas_tot_keys, [1,2,3,4,5,999])
+	if not panas_check.passed:
+		df['panas_error']=np.nan
+		df.panas_error=df.panas_error.replace([np.nan],["Your PANAS responses are not keyed appropriately (%s). Please compare your data to the accepted values in the script." % ', '.join(panas_check.offending_items)])
+		panas_result=df['panas_error']
+
+	else:
 	# ------------------------------------------------------------------------------
 	# Positive score
 
+		# Count the blank and "Prefer not to answer" responses of every item group in one pass
+		panas_missing = scoring_utils.missing_counts(df, [
+			('panas_positive', panas_positive_keys),
+			('panas_negative', panas_negative_keys)])
+
 	# Forward scores and questions unanswered
-			panas_positive = df[panas_positive_keys].apply(pd.to_numeric, args=('raise'))
-			panas_positive_leftblank = panas_positive.apply(lambda x: sum(x.isnull().values), axis=1)
-			panas_positive_prefernotanswer = panas_positive.apply(lambda x: sum(x==999), axis=1)
-			panas_positive_unanswered= panas_positive_leftblank+panas_positive_prefernotanswer
-		
-			# Sum all the forward scores
-			panas_positive_score = panas_positive[(panas_positive[panas_positive_keys] >= 1) & (panas_positive[panas_positive_keys] <= 5)].sum(axis=1)
-		
-			# Total score
-			panas_positive_score = panas_positive_score + (panas_positive_unanswered * panas_positive_score / (10-panas_positive_unanswered))
-		
-			positiveall = pd.DataFrame({'PANAS_Positive_Affect_Left_Blank' : panas_positive_leftblank, 'PANAS_Positive_Affect_Prefer_Not_to_Answer': panas_positive_prefernotanswer,'PANAS_Positive_Affect_Score': panas_positive_score})
-		
-			# Check for scores that are outside acceptable values 
-			for x in panas_positive_score:
-				if (x<10 or x>50) and x!=np.nan:
-					panas_positive_score=panas_positive_score.replace([x],["Warning: This PANAS_positive score (%d) falls outside of the accepted range (10 to 50). Please check your data and try again."  % x])
+		panas_positive = df[panas_positive_keys].apply(pd.to_numeric, args=('raise'))
+		panas_positive_leftblank = panas_missing.blank['panas_positive']
+		panas_positive_prefernotanswer = panas_missing.prefernotanswer['panas_positive']
+		panas_positive_unanswered= panas_positive_leftblank+panas_positive_prefernotanswer
+	
+		# Sum all the forward scores
+		panas_positive_score = panas_positive[(panas_positive[panas_positive_keys] >= 1) & (panas_positive[panas_positive_keys] <= 5)].sum(axis=1)
+	
+		# Total score
+		panas_positive_score = panas_positive_score + (panas_positive_unanswered * panas_positive_score / (10-panas_positive_unanswered))
+	
+		# Flag scores that are outside acceptable values
+		panas_positive_score_out_of_range = scoring_utils.out_of_range(panas_positive_score, 10, 50)
+
+		positiveall = pd.DataFrame({'PANAS_Positive_Affect_Left_Blank' : panas_positive_leftblank, 'PANAS_Positive_Affect_Prefer_Not_to_Answer': panas_positive_prefernotanswer,'PANAS_Positive_Affect_Score': panas_positive_score, 'PANAS_Positive_Affect_Out_of_Range': panas_positive_score_out_of_range})
+	
+		# ------------------------------------------------------------------------------
+		# Negative score
+	
+		# Forward scores and questions unanswered
+		panas_negative = df[panas_negative_keys].apply(pd.to_numeric, args=('raise',))
+		panas_negative_leftblank = panas_missing.blank['panas_negative']
+		panas_negative_prefernotanswer = panas_missing.prefernotanswer['panas_negative']
+		panas_negative_unanswered= panas_negative_leftblank+panas_negative_prefernotanswer
+	
+		# Sum all the forward scores
+		panas_negative_score = panas_negative[(panas_negative[panas_negative_keys] >= 1) & (panas_negative[panas_negative_keys] <= 5)].sum(axis=1)
+	
+		# Total score
+		panas_negative_score = panas_negative_score + (panas_negative_unanswered * panas_negative_score / (10-panas_negative_unanswered))
+	
+		# Flag scores that are outside acceptable values
+		panas_negative_score_out_of_range = scoring_utils.out_of_range(panas_negative_score, 10, 50)
+
+		negativeall = pd.DataFrame({'PANAS_Negative_Affect_Left_Blank' : panas_negative_leftblank, 'PANAS_Negative_Affect_Prefer_Not_to_Answer': panas_negative_prefernotanswer,'PANAS_Negative_Affect_Score': panas_negative_score, 'PANAS_Negative_Affect_Out_of_Range': panas_negative_score_out_of_range})
+	
+		# ------------------------------------------------------------------------------
+		#Generate Output 
 	
-			# ------------------------------------------------------------------------------
-			# Negative score
-		
-			# Forward scores and questions unanswered
-			panas_negative = df[panas_negative_keys].apply(pd.to_numeric, args=('raise',))
-			panas_negative_leftblank = panas_negative.apply(lambda x: sum(x.isnull().values), axis=1)
-			panas_negative_prefernotanswer = panas_negative.apply(lambda x: sum(x==999), axis=1)
-			panas_negative_unanswered= panas_negative_leftblank+panas_negative_prefernotanswer
-		
-			# Sum all the forward scores
-			panas_negative_score = panas_negative[(panas_negative[panas_negative_keys] >= 1) & (panas_negative[panas_negative_keys] <= 5)].sum(axis=1)
-		
-			# Total score
-			panas_negative_score = panas_negative_score + (panas_negative_unanswered * panas_negative_score / (10-panas_negative_unanswered))
-		
-			negativeall = pd.DataFrame({'PANAS_Negative_Affect_Left_Blank' : panas_negative_leftblank, 'PANAS_Negative_Affect_Prefer_Not_to_Answer': panas_negative_prefernotanswer,'PANAS_Negative_Affect_Score': panas_negative_score})
-		
-			# Check for scores that are outside acceptable values 
-			for x in panas_negative_score:
-				if (x<10 or x>50) and x!=np.nan:
-					panas_negative_score=panas_negative_score.replace([x],["Warning: This PANAS_negative score (%d) falls outside of the accepted range (10 to 50). Please check your data and try again."  % x])
-			# ------------------------------------------------------------------------------
-			#Generate Output 
-		
-			# Put the scores into one frame
-			panas_frames = [df.SUBJECT_ID, df.panas_0, positiveall,negativeall]
-			panas_result = pd.concat(panas_frames, axis=1)
+		# Put the scores into one frame
+		panas_frames = [df.SUBJECT_ID, df.panas_0, positiveall,negativeall]
+		panas_result = pd.concat(panas_frames, axis=1)
 	return panas_result
 
 #panas_result.to_csv(raw_input("Save your PANAS Output as: "))
@@ -0,0 +1,194 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import math
+from collections import OrderedDict
+
+import scale_specs
+
+# SINGLE RESPONDENT SCORING
+
+# Scores one respondent, given as a dict of item columns and responses as they appear in the export,
+# without building any data frames. Each scale is scored from its spec in scale_specs.py and gives
+# the same columns and values its *_analysis function gives for a one-row data frame: the same
+# error column when validation fails, the same range flags and the same exceptions. Nothing here imports
+# pandas, so a respondent is scored in microseconds rather than milliseconds.
+
+NAN = float('nan')
+
+# ------------------------------------------------------------------------------
+# Responses
+
+# Clean one response like automatedreader.normalize_data_frame: "Prefer not to answer" becomes 999,
+# then the response is lower-cased and stripped. Blank responses and '99999' become NaN.
+def clean_response(value, prefertonotanswer):
+	if value == prefertonotanswer:
+		value = 999
+	if value is None or value != value:
+		return NAN
+	text = str(value).lower().strip()
+	return NAN if text == '99999' else text
+
+# Return the number a cleaned response stands for, raising ValueError like pd.to_numeric(errors='raise')
+def response_number(value, labels):
+	if not isinstance(value, str):
+		return value
+	if value in labels:
+		return labels[value]
+	if value == '':
+		return NAN
+	if '_' in value or value.lstrip('+-') == 'nan':
+		raise ValueError('Unable to parse string "%s"' % value)
+	try:
+		return int(value)
+	except ValueError:
+		pass
+	try:
+		return float(value)
+	except ValueError:
+		raise ValueError('Unable to parse string "%s"' % value)
+
+# ------------------------------------------------------------------------------
+# Arithmetic
+
+# Divide like numpy: dividing by zero gives inf, or NaN for 0/0, instead of raising
+def divide(numerator, denominator):
+	if denominator:
+		return numerator / denominator
+	if numerator != numerator or numerator == 0:
+		return NAN
+	return math.copysign(math.inf, numerator)
+
+# Return whether a score fails a range check. Blank scores and scores without a check are not flagged.
+def out_of_range(score, check):
+	return check is not None and (score < check.low or score > check.high)
+
+# ------------------------------------------------------------------------------
+# Scoring
+
+# Return the (left blank, prefer not to answer, sum) of one group of items
+def score_group(values, group):
+	leftblank = prefernotanswer = 0
+	score = 0
+	complete = True
+	for key in group.keys:
+		value = values[key]
+		if value != value:
+			leftblank += 1
+			complete = False
+			continue
+		if value == 999:
+			prefernotanswer += 1
+		if (group.low is None or value >= group.low) and (group.high is None or value <= group.high):
+			score += value if group.reverse is None else group.reverse - value
+		else:
+			complete = False
+	if not (group.skipna or complete):
+		score = NAN
+	return leftblank, prefernotanswer, score
+
+# Sum the items of an 'impute' subscale again, with every unanswered item replaced by average
+def imputed_sum(values, groups, average):
+	score = 0
+	for group in groups:
+		for key in group.keys:
+			value = values[key]
+			if value != value or value == 999:
+				value = average
+			if (group.low is None or value >= group.low) and (group.high is None or value <= group.high):
+				score += value
+	return score
+
+# Return (left blank, prefer not to answer, unanswered, score, out of range) of a subscale
+def score_subscale(values, subscale):
+	groups = [score_group(values, group) for group in subscale.groups]
+	leftblank = sum(group[0] for group in groups)
+	prefernotanswer = sum(group[1] for group in groups)
+	score = groups[0][2]
+	for group in groups[1:]:
+		score = score + group[2]
+	if subscale.blank_is_pna:
+		leftblank = prefernotanswer
+	unanswered = leftblank + prefernotanswer
+	if subscale.zero_to_nan and score == 0:
+		score = NAN
+	if subscale.rule == 'prorate':
+		score = score + divide(unanswered * score, subscale.n - unanswered)
+	elif subscale.rule == 'mean':
+		score = divide(score, subscale.n - unanswered)
+	elif subscale.rule == 'impute':
+		score = imputed_sum(values, subscale.groups, divide(score, subscale.n - unanswered))
+	return leftblank, prefernotanswer, unanswered, score, out_of_range(score, subscale.check)
+
+# Return the same for a total over subscales that have already been scored. A subscale whose check
+# has no column of its own flags the total instead.
+def score_total(results, subscales, total):
+	parts = [results[name] for name in total.parts]
+	leftblank = sum(part[0] for part in parts)
+	prefernotanswer = sum(part[1] for part in parts)
+	unanswered = sum(part[2] for part in parts)
+	if total.rule == 'weighted_mean':
+		weighted = [part[3] * (subscales[name].n - part[2]) for name, part in zip(total.parts, parts)]
+		score = divide(sum(weighted[1:], weighted[0]), total.n - prefernotanswer)
+	else:
+		score = sum((part[3] for part in parts[1:]), parts[0][3])
+	flagged = out_of_range(score, total.check) or any(part[4] for name, part in zip(total.parts, parts)
+		if subscales[name].check is not None and subscales[name].check.column is None)
+	return leftblank, prefernotanswer, unanswered, score, flagged
+
+# Return the spec of a scale, raising ValueError for scales only the data frame path can score
+def scale_spec(name):
+	spec = scale_specs.scale_specs[name]
+	if spec is None:
+		raise ValueError("%s has no spec in scale_specs.py- score it with scale_registry.score_scale" % name)
+	return spec
+
+# Score one scale for one respondent and return its output columns in order
+def score_respondent(name, responses, prefertonotanswer="Prefer not to answer"):
+	spec = scale_spec(name)
+	values = OrderedDict()
+	for key in spec.keys:
+		values[key] = response_number(clean_response(responses[key], prefertonotanswer), spec.labels)
+
+	# Check for values that don't match parameters
+	offending_items = [key for key, value in values.items() if value == value and value not in spec.accepted]
+	if offending_items:
+		message = "Your %s responses are not keyed appropriately (%s). Please compare your data to the accepted values in the script."
+		return OrderedDict([(spec.error_column, message % (spec.error_label, ', '.join(offending_items)))])
+
+	results = {}
+	subscales = dict((subscale.name, subscale) for subscale in spec.subscales)
+	for subscale in spec.subscales:
+		results[subscale.name] = score_subscale(values, subscale)
+	blocks = dict((subscale.name, subscale) for subscale in spec.subscales)
+	for total in spec.totals:
+		results[total.name] = score_total(results, subscales, total)
+		blocks[total.name] = total
+
+	scores = OrderedDict()
+	if spec.subject_id:
+		scores['SUBJECT_ID'] = clean_response(responses['SUBJECT_ID'], prefertonotanswer)
+	for name in spec.outputs:
+		leftblank, prefernotanswer, unanswered, score, flagged = results[name]
+		for column, value in zip(blocks[name].columns, (leftblank, prefernotanswer, score)):
+			if column is not None:
+				scores[column] = value
+		check = blocks[name].check
+		if check is not None and check.column is not None:
+			scores[check.column] = flagged
+	return scores
+
+# Score every scale named in questionnaire_list for one respondent, like automatedreader.score_data_frame
+# does for one row: the scales' columns in registry order, each column once, then Total_Prefer_to_Not_Answer.
+def score_battery(questionnaire_list, responses, prefertonotanswer="Prefer not to answer"):
+	scores = OrderedDict()
+	for name in scale_specs.scale_specs:
+		if name in questionnaire_list:
+			for column, value in score_respondent(name, responses, prefertonotanswer).items():
+				scores.setdefault(column, value)
+	scores['Total_Prefer_to_Not_Answer'] = sum(1 for value in responses.values() if value == prefertonotanswer or value == 999)
+	return scores
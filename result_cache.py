@@ -0,0 +1,134 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import functools
+import hashlib
+import inspect
+import os
+import re
+import sys
+from collections import namedtuple
+
+import pandas as pd
+
+import encoded_store
+import item_codes
+import kernel_scoring
+import respondent_scoring
+import run_report
+import scale_registry
+import scale_specs
+import scoring_utils
+
+# RESULT CACHE
+
+# Each scale's result block is saved on its own, keyed by the scale, the source of its scoring script,
+# of scoring_utils and of scale_specs (which holds the item lists), and a hash of the cleaned columns the scale reads. A run that scores the same
+# responses with the same scripts reuses the block, even if other questionnaires were added to the run.
+# directory is the cache folder and limit its largest size in bytes.
+ResultCache = namedtuple('ResultCache', ['directory', 'limit'])
+
+# To remove cached results:
+#	python result_cache.py clear <cache folder> [scale ...]
+
+# ------------------------------------------------------------------------------
+# Keys
+
+# Return the hash of a scoring script, read once per process
+@functools.lru_cache(maxsize=None)
+def source_hash(path):
+	return encoded_store.file_hash(path)
+
+# Return the cache key of one scale's result, given the columns it reads
+def scale_key(name, frame, score_clean_rows=False):
+	key = hashlib.sha1()
+	key.update(name.encode('utf-8'))
+	key.update(source_hash(inspect.getsourcefile(scale_registry.scale_analysis(name))).encode('utf-8'))
+	key.update(source_hash(inspect.getsourcefile(scoring_utils)).encode('utf-8'))
+	key.update(source_hash(inspect.getsourcefile(scale_specs)).encode('utf-8'))
+	if item_codes.holds_codes(frame, name):
+		for module in (item_codes, kernel_scoring, respondent_scoring):
+			key.update(source_hash(inspect.getsourcefile(module)).encode('utf-8'))
+		if score_clean_rows:
+			key.update(b'score_clean_rows')
+	key.update(repr(list(frame.columns)).encode('utf-8'))
+	key.update(pd.util.hash_pandas_object(frame).to_numpy().tobytes())
+	return key.hexdigest()
+
+# Return the file a scale's result is cached in. The scale name is kept in the file name so the
+# results of one scale can be cleared.
+def block_path(cache, name, key):
+	return os.path.join(cache.directory, '%s-%s.pkl' % (re.sub('[^0-9A-Za-z]', '_', name), key))
+
+# ------------------------------------------------------------------------------
+# Scoring through the cache
+
+# Score the named scales like scale_registry.score_scales, reusing cached results where possible.
+# Only the scales that miss the cache are scored; their results are then saved.
+def cached_scales(cache, df, names, executor=None, report=None, score_clean_rows=False):
+	with run_report.measure(report, 'read result cache'):
+		paths = [block_path(cache, name, scale_key(name, df[scale_registry.scale_columns(name)], score_clean_rows)) for name in names]
+		results = [load_block(path) for path in paths]
+	missing = [i for i, result in enumerate(results) if result is None]
+	scored = scale_registry.score_scales(df, [names[i] for i in missing], executor, report, score_clean_rows)
+	with run_report.measure(report, 'save result cache'):
+		for i, result in zip(missing, scored):
+			save_block(paths[i], result)
+			results[i] = result
+		if missing:
+			prune(cache)
+	return results
+
+# Read a cached result, marking it as recently used. Returns None when it is not cached.
+def load_block(path):
+	if not os.path.exists(path):
+		return None
+	os.utime(path, None)
+	return pd.read_pickle(path)
+
+# Save a result, writing a temporary file first so a cached result is always complete
+def save_block(path, result):
+	if not os.path.isdir(os.path.dirname(path)):
+		os.makedirs(os.path.dirname(path))
+	temporary = '%s.tmp%d' % (path, os.getpid())
+	result.to_pickle(temporary)
+	os.replace(temporary, path)
+
+# ------------------------------------------------------------------------------
+# Size limit and clearing
+
+# Remove the least recently used results until the cache fits in its size limit
+def prune(cache):
+	blocks = []
+	for file_name in os.listdir(cache.directory):
+		if file_name.endswith('.pkl'):
+			path = os.path.join(cache.directory, file_name)
+			blocks.append((os.path.getmtime(path), os.path.getsize(path), path))
+	total = 0
+	for modified, size, path in sorted(blocks, reverse=True):
+		total += size
+		if total > cache.limit:
+			os.remove(path)
+
+# Remove every cached result, or only those of the named scales. Returns the number removed.
+def clear_cache(directory, names=None):
+	if not os.path.isdir(directory):
+		return 0
+	prefixes = None if not names else tuple(re.sub('[^0-9A-Za-z]', '_', name) + '-' for name in names)
+	removed = 0
+	for file_name in os.listdir(directory):
+		if file_name.endswith('.pkl') and (prefixes is None or file_name.startswith(prefixes)):
+			os.remove(os.path.join(directory, file_name))
+			removed += 1
+	return removed
+
+
+if __name__ == '__main__':
+	if len(sys.argv) < 3 or sys.argv[1] != 'clear':
+		print("Usage: python result_cache.py clear <cache folder> [scale ...]")
+		sys.exit(1)
+	print("Removed %d cached results" % clear_cache(sys.argv[2], sys.argv[3:]))
@@ -0,0 +1,152 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import datetime
+import re
+import sqlite3
+import sys
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+import scoring_utils
+
+# RESULTS STORE
+
+# Keeps the scores of every run in one SQLite file, so one participant's scores across waves and runs
+# can be looked up without reading every old output. Each run gets a row in the runs table, and each
+# scale has its own table (scale_asi, scale_bis_bas, ...) holding run_id, wave, scored_at, SUBJECT_ID
+# and that scale's output columns. A column a scale did not give before (its error column, say) is
+# added to its table when it first appears. The tables are indexed on SUBJECT_ID, wave and scored_at.
+#
+# The scores of a run are held in memory while it is scored and written in one short transaction when
+# it finishes, so a run that fails leaves nothing behind, and several exports scored side by side (see
+# batchreader.py and watchreader.py) only lock the database while each one is saved. Respondents an
+# incremental run keeps from the previous output are not stored again; the run that scored them did so.
+# SUBJECT_ID is stored cleaned like every other response (lower-cased and stripped), and subject_history
+# cleans the ID it is given the same way, so a participant is found by the ID as it appears in the export.
+
+# database is the SQLite file, run holds the (datafilepath, questionnaire_list, output_name) of the run,
+# wave and scored_at label it, and batches collects the (table, columns, rows) to insert when it finishes
+ResultsStore = namedtuple('ResultsStore', ['database', 'run', 'wave', 'scored_at', 'batches'])
+
+# Seconds a finishing run waits for another run to release the database
+LOCK_TIMEOUT = 60
+
+# To print one participant's stored scores:
+#	python results_store.py history <database> <SUBJECT_ID> [scale ...]
+
+# ------------------------------------------------------------------------------
+# Tables
+
+# Return the table a scale's scores are stored in
+def scale_table(name):
+	return 'scale_' + re.sub('[^0-9A-Za-z]', '_', name).lower()
+
+# Quote a column or table name for SQL
+def quoted(name):
+	return '"%s"' % str(name).replace('"', '""')
+
+# Return the columns a table has, in order (none if it does not exist)
+def table_columns(connection, table):
+	return [row[1] for row in connection.execute('PRAGMA table_info(%s)' % quoted(table))]
+
+# Create a scale's table and indexes if needed, and add any of columns it does not have yet
+def prepare_table(connection, table, columns):
+	if not table_columns(connection, table):
+		connection.execute('CREATE TABLE %s (run_id INTEGER NOT NULL, wave TEXT, scored_at TEXT NOT NULL, SUBJECT_ID TEXT)' % quoted(table))
+		connection.execute('CREATE INDEX %s ON %s (SUBJECT_ID, scored_at)' % (quoted(table + '_subject'), quoted(table)))
+		connection.execute('CREATE INDEX %s ON %s (wave)' % (quoted(table + '_wave'), quoted(table)))
+		connection.execute('CREATE INDEX %s ON %s (scored_at)' % (quoted(table + '_scored_at'), quoted(table)))
+	existing = set(table_columns(connection, table))
+	for column in columns:
+		if column not in existing:
+			connection.execute('ALTER TABLE %s ADD COLUMN %s' % (quoted(table), quoted(column)))
+
+# ------------------------------------------------------------------------------
+# Writing
+
+# Start a new run. Nothing is written to the database until finish_run.
+def start_run(database, wave=None, datafilepath=None, questionnaire_list=None, output_name=None):
+	scored_at = datetime.datetime.now().isoformat(timespec='microseconds')
+	return ResultsStore(database, (datafilepath, questionnaire_list, output_name), wave, scored_at, [])
+
+# Write the run and all of its scores in one transaction, or drop them when it failed
+def finish_run(store, failed=False):
+	if failed:
+		del store.batches[:]
+		return
+	connection = sqlite3.connect(store.database, timeout=LOCK_TIMEOUT)
+	try:
+		with connection:
+			connection.execute('CREATE TABLE IF NOT EXISTS runs (run_id INTEGER PRIMARY KEY, scored_at TEXT NOT NULL, wave TEXT, '
+				'datafilepath TEXT, questionnaire_list TEXT, output_name TEXT)')
+			run_id = connection.execute('INSERT INTO runs (scored_at, wave, datafilepath, questionnaire_list, output_name) VALUES (?, ?, ?, ?, ?)',
+				(store.scored_at, store.wave) + store.run).lastrowid
+			for table, columns, rows in store.batches:
+				prepare_table(connection, table, columns)
+				connection.executemany('INSERT INTO %s (run_id, wave, scored_at, SUBJECT_ID, %s) VALUES (%s)' % (quoted(table),
+					', '.join(quoted(column) for column in columns), ', '.join(['?'] * (len(columns) + 4))),
+					[(run_id, store.wave, store.scored_at) + row for row in rows])
+	finally:
+		connection.close()
+	del store.batches[:]
+
+# Return the values of a column as SQLite can store them: numpy numbers become Python numbers and blanks None
+def sql_values(column):
+	values = []
+	for value in column.tolist():
+		if isinstance(value, np.generic):
+			value = value.item()
+		if value is None or (isinstance(value, float) and value != value):
+			value = None
+		values.append(value)
+	return values
+
+# Add the results of the named scales to the run, one row per respondent. subject_ids gives each row's SUBJECT_ID.
+def save_results(store, names, results, subject_ids):
+	for name, result in zip(names, results):
+		if isinstance(result, pd.Series):
+			result = result.to_frame()
+		result = scoring_utils.decimal_scores(result)
+		columns = OrderedDict()
+		for position, column in enumerate(result.columns):
+			if column != 'SUBJECT_ID' and column not in columns:
+				columns[column] = sql_values(result.iloc[:, position])
+		rows = list(zip(*([[str(subject_id) for subject_id in subject_ids]] + list(columns.values()))))
+		store.batches.append((scale_table(name), list(columns), rows))
+
+# ------------------------------------------------------------------------------
+# Reading
+
+# Return the stored scores of one participant: an OrderedDict from each scale to a frame with one row per
+# run, oldest first. names limits the scales looked at; scales with no scores for them are left out.
+def subject_history(database, subject_id, names=None):
+	subject_id = scoring_utils.clean_responses([str(subject_id)]).iloc[0]
+	connection = sqlite3.connect(database)
+	try:
+		tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'scale\\_%' ESCAPE '\\' ORDER BY name")]
+		if names:
+			tables = [table for table in tables if table in [scale_table(name) for name in names]]
+		history = OrderedDict()
+		for table in tables:
+			scores = pd.read_sql_query('SELECT * FROM %s WHERE SUBJECT_ID = ? ORDER BY scored_at' % quoted(table), connection, params=(str(subject_id),))
+			if len(scores):
+				history[table[len('scale_'):]] = scores
+		return history
+	finally:
+		connection.close()
+
+
+if __name__ == '__main__':
+	if len(sys.argv) < 4 or sys.argv[1] != 'history':
+		print("Usage: python results_store.py history <database> <SUBJECT_ID> [scale ...]")
+		sys.exit(1)
+	for table, scores in subject_history(sys.argv[2], sys.argv[3], sys.argv[4:]).items():
+		print(table)
+		print(scores.to_string(index=False))
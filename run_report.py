@@ -0,0 +1,140 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import contextlib
+import json
+import platform
+import time
+import tracemalloc
+from collections import OrderedDict, namedtuple
+
+# RUN REPORT
+
+# Records the wall time, CPU time and peak memory of each stage of a run (reading the csv, cleaning the
+# responses, scoring each scale, combining the results and writing the output) and saves them next to
+# the output as <output_name>.report.json. A stage that runs once per chunk is added up over the chunks.
+# Peak memory is measured with tracemalloc, which slows the run down while the report is kept.
+#
+# A scale scored on a worker process is measured in that process, so its CPU time and peak memory are
+# the worker's own; the stages around it only count the memory of the main process.
+
+# One measurement: seconds of wall time and CPU time, and the most memory allocated at once in bytes
+Measurement = namedtuple('Measurement', ['wall', 'cpu', 'peak'])
+
+# settings are saved in the report as they are; stages maps each stage name to its measurements.
+# start is when the report was started and highest holds the most memory allocated at once so far.
+RunReport = namedtuple('RunReport', ['settings', 'stages', 'start', 'highest'])
+
+# ------------------------------------------------------------------------------
+# Measuring
+
+# Start a report. tracemalloc is started here and stopped by stop_report.
+def start_report(settings):
+	if not tracemalloc.is_tracing():
+		tracemalloc.start()
+	return RunReport(OrderedDict(settings), OrderedDict(), start_measurement(), [0])
+
+# Add a measurement to a stage of the report
+def add_measurement(report, stage, measurement):
+	report.stages.setdefault(stage, []).append(measurement)
+
+# Measure the code run inside the with block as one stage of the report. report may be None, in
+# which case nothing is measured. The peak is the most memory allocated at once beyond what was
+# already allocated when the stage started.
+@contextlib.contextmanager
+def measure(report, stage):
+	if report is None:
+		yield
+		return
+	start = start_measurement(report)
+	yield
+	add_measurement(report, stage, stop_measurement(start, report))
+
+# Return the clocks and the memory allocated when a measurement starts. tracemalloc only keeps one
+# peak, so the peak so far is first noted in the report before it is reset.
+def start_measurement(report=None):
+	if report is not None:
+		report.highest[0] = max(report.highest[0], tracemalloc.get_traced_memory()[1])
+	if tracemalloc.is_tracing():
+		tracemalloc.reset_peak()
+	return (time.perf_counter(), time.process_time(), tracemalloc.get_traced_memory()[0])
+
+# Return the Measurement since start
+def stop_measurement(start, report=None):
+	if report is not None:
+		report.highest[0] = max(report.highest[0], tracemalloc.get_traced_memory()[1])
+	wall, cpu, memory = start
+	peak = tracemalloc.get_traced_memory()[1] - memory if tracemalloc.is_tracing() else 0
+	return Measurement(time.perf_counter() - wall, time.process_time() - cpu, max(peak, 0))
+
+# Stop tracemalloc and return the Measurement of the whole run
+def stop_report(report):
+	wall, cpu, memory = report.start
+	highest = max(report.highest[0], tracemalloc.get_traced_memory()[1])
+	tracemalloc.stop()
+	return Measurement(time.perf_counter() - wall, time.process_time() - cpu, max(highest - memory, 0))
+
+# Call function(*args) and return its result with its Measurement. Used on worker processes, where
+# tracemalloc is only started for the call.
+def measured_call(function, *args):
+	tracing = tracemalloc.is_tracing()
+	if not tracing:
+		tracemalloc.start()
+	try:
+		start = start_measurement()
+		result = function(*args)
+		return result, stop_measurement(start)
+	finally:
+		if not tracing:
+			tracemalloc.stop()
+
+# Yield the items of iterable, measuring the time taken to produce each one as a stage of the report
+def measured_items(report, stage, iterable):
+	if report is None:
+		yield from iterable
+		return
+	iterator = iter(iterable)
+	while True:
+		start = start_measurement(report)
+		item = next(iterator, StopIteration)
+		if item is StopIteration:
+			return
+		add_measurement(report, stage, stop_measurement(start, report))
+		yield item
+
+# ------------------------------------------------------------------------------
+# Output
+
+# Return the file the report of output_name is saved in
+def report_path(output_name):
+	return output_name + '.report.json'
+
+# Return one row per stage: how often it ran and its total wall and CPU time and largest peak
+def stage_rows(report):
+	rows = []
+	for stage, measurements in report.stages.items():
+		rows.append(OrderedDict([('stage', stage), ('calls', len(measurements)),
+			('wall_seconds', sum(measurement.wall for measurement in measurements)),
+			('cpu_seconds', sum(measurement.cpu for measurement in measurements)),
+			('peak_bytes', max(measurement.peak for measurement in measurements))]))
+	return rows
+
+# Save the report next to the output
+def save_report(report, output_name, total):
+	contents = OrderedDict(report.settings)
+	contents['python'] = platform.python_version()
+	contents['total'] = OrderedDict([('wall_seconds', total.wall), ('cpu_seconds', total.cpu), ('peak_bytes', total.peak)])
+	contents['stages'] = stage_rows(report)
+	with open(report_path(output_name), 'w') as report_file:
+		json.dump(contents, report_file, indent=2)
+
+# Print the report as a table
+def print_report(report, total):
+	print("%-24s %6s %10s %10s %10s" % ('Stage', 'Calls', 'Wall (s)', 'CPU (s)', 'Peak (MB)'))
+	for row in stage_rows(report):
+		print("%-24s %6d %10.3f %10.3f %10.1f" % (row['stage'], row['calls'], row['wall_seconds'], row['cpu_seconds'], row['peak_bytes'] / 1048576.0))
+	print("%-24s %6s %10.3f %10.3f %10.1f" % ('Total', '', total.wall, total.cpu, total.peak / 1048576.0))
@@ -0,0 +1,183 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import contextlib
+import functools
+import importlib
+import importlib.metadata
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import item_codes
+import kernel_scoring
+import run_report
+import scoring_utils
+
+# SCALE REGISTRY
+
+# Every questionnaire that can be listed in questionnaire_list, the module that scores it, its scoring
+# function and the list of item columns that function reads. A scoring module is only imported once
+# its scale is selected, so a run only pays for the questionnaires it scores.
+ScaleEntry = namedtuple('ScaleEntry', ['module', 'analysis', 'keys'])
+
+scale_registry = OrderedDict([
+	('ASI', ScaleEntry('asi_scoring', 'asi_analysis', 'asi_tot_keys')),
+	('BAPQ', ScaleEntry('bapq_scoring', 'bapq_analysis', 'bapq_tot_keys')),
+	('BARRATT', ScaleEntry('bis_scoring', 'bis_analysis', 'bis_tot_keys')),
+	('BIS/BAS', ScaleEntry('bisbas_scoring', 'bisbas_analysis', 'bisbas_tot_keys')),
+	('DOSPERT(S)', ScaleEntry('dospert_s_scoring', 'dospert_s_analysis', 'dospert_s_tot_keys')),
+	('DOSPERT(40)', ScaleEntry('dospert40_scoring', 'dospert40_analysis', 'dospert40_tot_keys')),
+	('ECR-R10', ScaleEntry('ecrr10_scoring', 'ecrr10_analysis', 'ecrr10_tot_keys')),
+	('NEO-FFI', ScaleEntry('neoffi_scoring', 'neoffi_analysis', 'neoffi_tot_keys')),
+	('PANAS', ScaleEntry('panas_scoring', 'panas_analysis', 'panas_tot_keys')),
+	('PSS', ScaleEntry('pss_scoring', 'pss_analysis', 'pss_tot_keys')),
+	('QIDS', ScaleEntry('qids_scoring', 'qids_analysis', 'qids_keys')),
+	('A-RSQ', ScaleEntry('rsqa_scoring', 'rsqa_analysis', 'rsqa_tot_key')),
+	('RSRI', ScaleEntry('rsri_scoring', 'rsri_analysis', 'rsri_tot')),
+	('SAQ-A', ScaleEntry('saqa_scoring', 'saqa_analysis', 'saqa_headers')),
+	('SNI', ScaleEntry('sni_scoring', 'sni_analysis', 'sni_keys')),
+	('STAI', ScaleEntry('stai_scoring', 'stai_analysis', 'stai_tot_keys')),
+	('TCI', ScaleEntry('tci_scoring', 'tci_analysis', 'tci_tot_keys')),
+])
+
+# Questionnaires can also ship as separate packages. A package adds one by declaring an entry point
+# in this group, named after the questionnaire and pointing to a (scoring function, item columns) pair:
+#	[project.entry-points."battery_scores.scales"]
+#	"NFC(S)" = "nfc_s_scoring:nfc_s_scale"
+# where nfc_s_scoring.py sets nfc_s_scale = (nfc_s_analysis, nfc_s_tot_keys). Plugin scales are scored
+# after the scales above, in name order, and cannot replace one of them.
+plugin_group = 'battery_scores.scales'
+
+# Scales already imported in this process: name -> (scoring function, item columns)
+loaded_scales = {}
+
+# ------------------------------------------------------------------------------
+# Loading
+
+# Return the installed plugin scales: name -> entry point. Entry points are only looked up when
+# questionnaire_list names a scale that is not registered above.
+@functools.lru_cache(maxsize=None)
+def plugin_scales():
+	found = OrderedDict()
+	for entry_point in sorted(importlib.metadata.entry_points(group=plugin_group), key=lambda entry_point: entry_point.name):
+		if entry_point.name not in scale_registry:
+			found.setdefault(entry_point.name, entry_point)
+	return found
+
+# Import a scale's scoring module and return its (scoring function, item columns)
+def load_scale(name):
+	if name not in loaded_scales:
+		if name in scale_registry:
+			entry = scale_registry[name]
+			module = importlib.import_module(entry.module)
+			loaded_scales[name] = (getattr(module, entry.analysis), getattr(module, entry.keys))
+		else:
+			analysis, keys = plugin_scales()[name].load()
+			loaded_scales[name] = (analysis, keys)
+	return loaded_scales[name]
+
+# Return the function that scores a scale
+def scale_analysis(name):
+	return load_scale(name)[0]
+
+# ------------------------------------------------------------------------------
+# Scale selection
+
+# Return the scales named in questionnaire_list, in registry order, followed by any plugin scales it names.
+# Raises a ValueError listing the names that are neither registered nor installed as plugins.
+def selected_scales(questionnaire_list):
+	listed = [name.strip() for name in questionnaire_list.split(',') if name.strip()]
+	names = [name for name in scale_registry if name in listed]
+	unknown = [name for name in listed if name not in scale_registry]
+	if unknown:
+		names += [name for name in plugin_scales() if name in unknown]
+		unknown = [name for name in unknown if name not in names]
+	if unknown:
+		raise ValueError("Your questionnaire_list names %s, which no scoring script or installed plugin scores. Please list the "
+			"questionnaires separated by commas, spelled as in: %s" % (', '.join(unknown), ','.join(scale_registry)))
+	return names
+
+# Return the columns a scale's scoring function needs, including SUBJECT_ID
+def scale_columns(name):
+	return ['SUBJECT_ID'] + list(load_scale(name)[1])
+
+# Return every column the named scales need, each listed once. SUBJECT_ID is always included,
+# so every row of the export is still read when no scale is selected.
+def selected_columns(names):
+	columns = ['SUBJECT_ID']
+	for name in names:
+		columns += [column for column in scale_columns(name) if column not in columns]
+	return columns
+
+# ------------------------------------------------------------------------------
+# Scoring
+
+# Score a single scale. The frame only has to hold that scale's columns (see scale_columns).
+# A scale whose items the frame holds as item codes (see automatedreader.coded_data_frame) is scored
+# by kernel_scoring, and any other by its *_analysis function. Scores are returned as float32.
+# score_clean_rows is passed on to kernel_scoring.score_codes; the *_analysis functions do not support it.
+def score_scale(name, df, score_clean_rows=False):
+	if item_codes.holds_codes(df, name):
+		return kernel_scoring.score_codes(name, item_codes.frame_codes(df, [name]), score_clean_rows)
+	return scoring_utils.compact_scores(scale_analysis(name)(df))
+
+# Run when a worker process starts. Imports pandas and the scoring modules of the named scales, and
+# compiles the kernels of the scales scored from item codes (coded_names), so the first job a worker
+# gets is not slowed down by imports or compiling.
+def warm_up(names=(), coded_names=()):
+	for name in names:
+		load_scale(name)
+	for name in coded_names:
+		kernel_scoring.compile_kernel(name)
+	return len(loaded_scales)
+
+# Start the process pool used by score_scales, with workers that import the named scales and compile the
+# kernels of coded_names as they start (see warm_up). max_workers=None uses every core; max_workers=1
+# gives no pool, so the scales are scored one at a time in this process.
+def scoring_pool(max_workers=None, names=(), coded_names=()):
+	if max_workers == 1:
+		return contextlib.nullcontext()
+	return ProcessPoolExecutor(max_workers=max_workers, initializer=warm_up, initargs=(tuple(names), tuple(coded_names)))
+
+# Score the named scales and return their results in the same order as names.
+# Each scale is handed its own copy of just the columns it reads, so the scales can be
+# scored side by side on the executor from scoring_pool (or one at a time if it is None).
+# With a run report, each scale is measured as its own stage (see run_report.py).
+def score_scales(df, names, executor=None, report=None, score_clean_rows=False):
+	frames = [df[scale_columns(name)].copy() for name in names]
+	if executor is None or len(names) < 2:
+		results = []
+		for name, frame in zip(names, frames):
+			with run_report.measure(report, 'score ' + name):
+				results.append(score_scale(name, frame, score_clean_rows))
+		return results
+	if report is None:
+		return list(executor.map(score_scale, names, frames, [score_clean_rows] * len(names)))
+	results = []
+	for name, (result, measurement) in zip(names, executor.map(run_report.measured_call, [score_scale] * len(names), names, frames,
+			[score_clean_rows] * len(names))):
+		run_report.add_measurement(report, 'score ' + name, measurement)
+		results.append(result)
+	return results
+
+# ------------------------------------------------------------------------------
+# Output
+
+# Combine the scored scales into one frame. Every result holds the same rows, so the columns are
+# gathered in order and the frame is built once. A column already taken from an earlier result
+# (SUBJECT_ID, or the NEO-FFI openness block that neoffi_analysis lists twice) is not added again.
+def combine_results(results):
+	columns = OrderedDict()
+	for result in results:
+		if isinstance(result, pd.Series):
+			result = result.to_frame()
+		for position, name in enumerate(result.columns):
+			if name not in columns:
+				columns[name] = result.iloc[:, position]
+	return pd.DataFrame(columns)
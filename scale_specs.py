@@ -0,0 +1,440 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+from collections import OrderedDict, namedtuple
+
+# SCALE SPECIFICATIONS
+
+# The scoring rules of each *_analysis function written out as plain data, so a scale can be scored
+# without pandas (see respondent_scoring.py) or compiled into a NumPy kernel (see kernel_scoring.py).
+# Each spec follows its *_scoring.py module exactly, including the filters, constants and range checks
+# that differ between subscales of one scale.
+# The item lists here are the only copy: the *_scoring.py modules of these scales import them, so the
+# *_analysis functions and the engines scoring from these specs always read the same items.
+# This module must not import pandas or the *_scoring.py modules.
+
+# A scale: its item columns, the text answers replaced by codes, the codes validate_items accepts,
+# the error column and label used when validation fails, whether SUBJECT_ID leads the output,
+# its subscales and totals in the order they are scored, and the blocks of the output in order.
+Scale = namedtuple('Scale', ['keys', 'labels', 'accepted', 'error_column', 'error_label', 'subject_id',
+	'subscales', 'totals', 'outputs'])
+
+# Items summed together. Only codes between low and high (None for no bound) count; reverse is the
+# constant they are subtracted from (None for forward items). With skipna False the sum is NaN as soon
+# as one item does not count, as with .sum(axis=1, skipna=False).
+ItemGroup = namedtuple('ItemGroup', ['keys', 'low', 'high', 'reverse', 'skipna'])
+
+# A subscale. columns are its (left blank, prefer not to answer, score) output columns, any of which
+# may be None; rule is how missing items are handled:
+#	'sum'		the sum of the items that count
+#	'prorate'	sum + unanswered * sum / (n - unanswered)
+#	'mean'		sum / (n - unanswered)
+#	'impute'	every unanswered item is replaced by sum / (n - unanswered) and the items summed again
+# zero_to_nan replaces a sum of 0 with NaN first. blank_is_pna counts "Prefer not to answer" as the
+# left blank count, as the NEO-FFI openness domain does.
+Subscale = namedtuple('Subscale', ['name', 'columns', 'groups', 'rule', 'n', 'zero_to_nan', 'check', 'blank_is_pna'])
+
+# A total over subscales. rule 'sum' adds their scores; 'weighted_mean' weights each score by its
+# answered items and divides by n less every "Prefer not to answer", as the BAPQ total does.
+Total = namedtuple('Total', ['name', 'columns', 'parts', 'rule', 'n', 'check'])
+
+# A range check: scores below low or above high are flagged True in the column named column, which
+# follows the score in the output. A check whose column is None flags the totals built on the score.
+RangeCheck = namedtuple('RangeCheck', ['low', 'high', 'column'])
+
+# ------------------------------------------------------------------------------
+# Helpers
+
+def forward(keys, low=None, high=None):
+	return ItemGroup(keys, low, high, None, True)
+
+def reverse(keys, constant, low=None, high=None, skipna=True):
+	return ItemGroup(keys, low, high, constant, skipna)
+
+def subscale(name, columns, groups, rule='prorate', n=None, zero_to_nan=False, check=None, blank_is_pna=False):
+	if n is None:
+		n = sum(len(group.keys) for group in groups)
+	return Subscale(name, columns, groups, rule, n, zero_to_nan, check, blank_is_pna)
+
+def total(name, columns, parts, rule='sum', n=None, check=None):
+	return Total(name, columns, parts, rule, n, check)
+
+def range_check(column, low, high):
+	return RangeCheck(low, high, column)
+
+# Output columns named <prefix>_Left_Blank, <prefix>_Prefer_Not_to_Answer and <prefix>_Score
+def columns(prefix):
+	return (prefix + '_Left_Blank', prefix + '_Prefer_Not_to_Answer', prefix + '_Score')
+
+# ------------------------------------------------------------------------------
+# ASI
+
+asi_tot_keys = ['asi_1', 'asi_2', 'asi_3', 'asi_4', 'asi_5', 'asi_6', 'asi_7', 'asi_8', 'asi_9', 'asi_10', 'asi_11', 'asi_12',
+	'asi_13', 'asi_14', 'asi_15', 'asi_16']
+
+asi = Scale(asi_tot_keys,
+	{'very little': 0, 'a little': 1, 'some': 2, 'much': 3, 'very much': 4},
+	[0, 1, 2, 3, 4, 999], 'asi_error', 'ASI', True,
+	[subscale('asi', columns('ASI'), [forward(asi_tot_keys, high=4)], check=range_check('ASI_Out_of_Range', 0, 64))],
+	[], ['asi'])
+
+# ------------------------------------------------------------------------------
+# BAPQ
+
+bapq_aloof_keys = ['bapq_5', 'bapq_18', 'bapq_27', 'bapq_31']
+bapq_aloof_reverse_keys = ['bapq_1', 'bapq_9', 'bapq_12', 'bapq_16', 'bapq_23', 'bapq_25', 'bapq_28', 'bapq_36']
+bapq_rigid_keys = ['bapq_6', 'bapq_8', 'bapq_13', 'bapq_22', 'bapq_24', 'bapq_26', 'bapq_33', 'bapq_35']
+bapq_rigid_reverse_keys = ['bapq_3', 'bapq_15', 'bapq_19', 'bapq_30']
+bapq_pragmatic_keys = ['bapq_2', 'bapq_4', 'bapq_10', 'bapq_11', 'bapq_14', 'bapq_17', 'bapq_20', 'bapq_29', 'bapq_32']
+bapq_pragmatic_reverse_keys = ['bapq_7', 'bapq_21', 'bapq_34']
+bapq_tot_keys = (bapq_aloof_keys + bapq_aloof_reverse_keys + bapq_rigid_keys + bapq_rigid_reverse_keys + bapq_pragmatic_keys
+	+ bapq_pragmatic_reverse_keys)
+
+bapq = Scale(bapq_tot_keys,
+	{'very rarely': 1, 'rarely': 2, 'occasionally': 3, 'somewhat often': 4, 'often': 5, 'very often': 6},
+	[0, 1, 2, 3, 4, 5, 6, 999], 'bapq_error', 'BAPQ', True,
+	[subscale('aloof', columns('BAPQ_A'), [forward(bapq_aloof_keys, 1, 6), reverse(bapq_aloof_reverse_keys, 7, high=6)],
+		'mean', 12, check=range_check('BAPQ_A_Out_of_Range', 1, 6)),
+	subscale('rigid', columns('BAPQ_R'), [forward(bapq_rigid_keys, 1, 6), reverse(bapq_rigid_reverse_keys, 7, high=6)],
+		'mean', 12, check=range_check('BAPQ_R_Out_of_Range', 1, 6)),
+	subscale('pragmatic', columns('BAPQ_P'), [forward(bapq_pragmatic_keys, 1, 6), reverse(bapq_pragmatic_reverse_keys, 7, high=6)],
+		'mean', 12, check=range_check('BAPQ_P_Out_of_Range', 1, 6))],
+	[total('total', ('BAPQ_Left_Blank', 'BAPQ_Prefer_Not_To_Answer', 'BAPQ_Score'), ['aloof', 'rigid', 'pragmatic'],
+		'weighted_mean', 36, check=range_check('BAPQ_Out_of_Range', 1, 6))],
+	['aloof', 'rigid', 'pragmatic', 'total'])
+
+# ------------------------------------------------------------------------------
+# BARRATT (BIS-11)
+
+bis_1atten_keys = ['bis_5', 'bis_11', 'bis_28']
+bis_1atten_rev_keys = ['bis_9', 'bis_20']
+bis_1instability_keys = ['bis_6', 'bis_24', 'bis_26']
+bis_1mot_keys = ['bis_2', 'bis_3', 'bis_4', 'bis_17', 'bis_19', 'bis_22', 'bis_25']
+bis_1persever_keys = ['bis_16', 'bis_21', 'bis_23']
+bis_1persever_rev_keys = ['bis_30']
+bis_1selfcontrol_keys = ['bis_14']
+bis_1selfcontrol_rev_keys = ['bis_1', 'bis_7', 'bis_8', 'bis_12', 'bis_13']
+bis_1complex_keys = ['bis_18', 'bis_27']
+bis_1complex_rev_keys = ['bis_10', 'bis_15', 'bis_29']
+bis_2attentionalimpulsiveness_keys = ['bis_5', 'bis_6', 'bis_11', 'bis_24', 'bis_26', 'bis_28']
+bis_2attentionalimpulsiveness_rev_keys = ['bis_9', 'bis_20']
+bis_2motorimpulsiveness_keys = ['bis_2', 'bis_3', 'bis_4', 'bis_16', 'bis_17', 'bis_19', 'bis_21', 'bis_22', 'bis_23', 'bis_25']
+bis_2motorimpulsiveness_rev_keys = ['bis_30']
+bis_2nonplanningimpulsiveness_keys = ['bis_14', 'bis_18', 'bis_27']
+bis_2nonplanningimpulsiveness_rev_keys = ['bis_1', 'bis_7', 'bis_8', 'bis_10', 'bis_12', 'bis_13', 'bis_15', 'bis_29']
+bis_tot_keys = (bis_1atten_keys + bis_1atten_rev_keys + bis_1instability_keys + bis_1mot_keys + bis_1persever_keys
+	+ bis_1persever_rev_keys + bis_1selfcontrol_keys + bis_1selfcontrol_rev_keys + bis_1complex_keys + bis_1complex_rev_keys)
+
+def bis_subscale(name, prefix, keys, rev_keys, n, low, high):
+	groups = [forward(keys, high=4)]
+	if rev_keys:
+		groups.append(reverse(rev_keys, 5, high=4))
+	return subscale(name, columns(prefix), groups, n=n, zero_to_nan=True, check=range_check(prefix + '_Out_of_Range', low, high))
+
+# The BIS labels keep their capitals, so they only match responses that are not lower-cased
+barratt = Scale(bis_tot_keys,
+	{'Rarely/Never': 1, 'Occasionally': 2, 'Often': 3, 'Almost Always/Always': 4, 'Prefer not to answer': 999},
+	[1, 2, 3, 4, 999], 'bis_error', 'BIS', False,
+	[bis_subscale('attention', 'BIS_Attention', bis_1atten_keys, bis_1atten_rev_keys, 5, 5, 20),
+	bis_subscale('instability', 'BIS_Cognitive_Instability', bis_1instability_keys, [], 3, 3, 12),
+	bis_subscale('motor', 'BIS_Motor', bis_1mot_keys, [], 7, 7, 28),
+	bis_subscale('selfcontrol', 'BIS_Self_Control', bis_1selfcontrol_keys, bis_1selfcontrol_rev_keys, 6, 6, 24),
+	bis_subscale('complexity', 'BIS_Cognitive_Complexity', bis_1complex_keys, bis_1complex_rev_keys, 5, 5, 20),
+	bis_subscale('perseverance', 'BIS_Perseverance', bis_1persever_keys, bis_1persever_rev_keys, 4, 4, 16),
+	bis_subscale('attentional', 'BIS_Attentional_Impulsiveness', bis_2attentionalimpulsiveness_keys,
+		bis_2attentionalimpulsiveness_rev_keys, 8, 8, 32),
+	bis_subscale('motorimpulsiveness', 'BIS_Motor_Impulsiveness', bis_2motorimpulsiveness_keys,
+		bis_2motorimpulsiveness_rev_keys, 11, 11, 44),
+	bis_subscale('nonplanning', 'BIS_Nonplanning_Impulsiveness', bis_2nonplanningimpulsiveness_keys,
+		bis_2nonplanningimpulsiveness_rev_keys, 11, 11, 44)],
+	[], ['attention', 'instability', 'motor', 'selfcontrol', 'complexity', 'perseverance', 'attentional',
+	'motorimpulsiveness', 'nonplanning'])
+
+# ------------------------------------------------------------------------------
+# BIS/BAS
+
+drive_headers = ['bisbas_3', 'bisbas_9', 'bisbas_12', 'bisbas_21']
+funseeking_headers = ['bisbas_5', 'bisbas_10', 'bisbas_15', 'bisbas_20']
+reward_headers = ['bisbas_4', 'bisbas_7', 'bisbas_14', 'bisbas_18', 'bisbas_23']
+forward_code_bis = ['bisbas_2', 'bisbas_22']
+reverse_code_bis = ['bisbas_8', 'bisbas_13', 'bisbas_16', 'bisbas_19', 'bisbas_24']
+fillerheaders = ['bisbas_1', 'bisbas_6', 'bisbas_11', 'bisbas_17']
+bisbas_tot_keys = drive_headers + funseeking_headers + reward_headers + forward_code_bis + reverse_code_bis + fillerheaders
+
+bisbas = Scale(bisbas_tot_keys,
+	{'very true': 1, 'somewhat true': 2, 'somewhat false': 3, 'very false': 4},
+	[1, 2, 3, 4, 999], 'bisbas_error', 'BIS/BAS', True,
+	[subscale('drive', columns('BAS_D'), [reverse(drive_headers, 5, high=4)], check=range_check('BAS_D_Out_of_Range', 4, 16)),
+	subscale('funseeking', columns('BAS_F'), [reverse(funseeking_headers, 5, high=4)],
+		check=range_check('BAS_F_Out_of_Range', 4, 16)),
+	subscale('reward', columns('BAS_R'), [reverse(reward_headers, 5, high=4)], check=range_check('BAS_R_Out_of_Range', 5, 20)),
+	subscale('bis', columns('BIS'), [reverse(reverse_code_bis, 5, high=4), forward(forward_code_bis, 1, 4)],
+		check=range_check('BIS_Out_of_Range', 7, 28))],
+	[], ['drive', 'funseeking', 'reward', 'bis'])
+
+# ------------------------------------------------------------------------------
+# DOSPERT(S)
+
+dospert_risk_labels = {'very unlikely': 1, 'unlikely': 2, 'not sure': 3, 'likely': 4, 'very likely': 5,
+	'not at all risky': 1, 'slightly risky': 2, 'moderately risky': 3, 'very risky': 4, 'extremely risky': 5}
+
+dospert_s_risktaking_keys = ['dospert_s_1', 'dospert_s_2', 'dospert_s_3', 'dospert_s_4', 'dospert_s_5', 'dospert_s_6',
+	'dospert_s_7', 'dospert_s_8']
+dospert_s_riskperception_keys = ['dospert_s_9', 'dospert_s_10', 'dospert_s_11', 'dospert_s_12', 'dospert_s_13', 'dospert_s_14',
+	'dospert_s_15', 'dospert_s_16']
+dospert_s_tot_keys = dospert_s_risktaking_keys + dospert_s_riskperception_keys
+
+dospert_s = Scale(dospert_s_tot_keys, dospert_risk_labels,
+	[1, 2, 3, 4, 5, 999], 'dospert_s_error', 'DOSPERT(S)', True,
+	[subscale('risktaking', columns('DOSPERT(S)_Risktaking'), [forward(dospert_s_risktaking_keys, high=7)],
+		check=range_check('DOSPERT(S)_Risktaking_Out_of_Range', 8, 56)),
+	subscale('riskperception', columns('DOSPERT(S)_Riskperception'), [forward(dospert_s_riskperception_keys, high=7)],
+		check=range_check('DOSPERT(S)_Riskperception_Out_of_Range', 8, 56))],
+	[], ['risktaking', 'riskperception'])
+
+# ------------------------------------------------------------------------------
+# DOSPERT(40)
+
+risktaking_social_keys = ['dospert40_1', 'dospert40_8', 'dospert40_13', 'dospert40_16', 'dospert40_27', 'dospert40_30',
+	'dospert40_37', 'dospert40_38']
+riskperception_social_keys = ['dospert40_41', 'dospert40_48', 'dospert40_53', 'dospert40_56', 'dospert40_67', 'dospert40_70',
+	'dospert40_77', 'dospert40_78']
+risktaking_financial_keys = ['dospert40_3', 'dospert40_5', 'dospert40_9', 'dospert40_15', 'dospert40_18', 'dospert40_19',
+	'dospert40_23', 'dospert40_26']
+riskperception_financial_keys = ['dospert40_43', 'dospert40_45', 'dospert40_49', 'dospert40_55', 'dospert40_58', 'dospert40_59',
+	'dospert40_63', 'dospert40_66']
+risktaking_healthsafety_keys = ['dospert40_6', 'dospert40_20', 'dospert40_22', 'dospert40_25', 'dospert40_31', 'dospert40_34',
+	'dospert40_35', 'dospert40_36']
+riskperception_healthsafety_keys = ['dospert40_46', 'dospert40_60', 'dospert40_62', 'dospert40_65', 'dospert40_71', 'dospert40_74',
+	'dospert40_75', 'dospert40_76']
+risktaking_recreational_keys = ['dospert40_2', 'dospert40_4', 'dospert40_12', 'dospert40_14', 'dospert40_17', 'dospert40_24',
+	'dospert40_32', 'dospert40_33']
+riskperception_recreational_keys = ['dospert40_42', 'dospert40_44', 'dospert40_52', 'dospert40_54', 'dospert40_57', 'dospert40_64',
+	'dospert40_72', 'dospert40_73']
+risktaking_ethical_keys = ['dospert40_7', 'dospert40_10', 'dospert40_11', 'dospert40_21', 'dospert40_28', 'dospert40_29',
+	'dospert40_39', 'dospert40_40']
+riskperception_ethical_keys = ['dospert40_47', 'dospert40_50', 'dospert40_51', 'dospert40_61', 'dospert40_68', 'dospert40_69',
+	'dospert40_79', 'dospert40_80']
+dospert40_risktaking_keys = ['dospert40_%d' % item for item in range(1, 41)]
+dospert40_riskperception_keys = ['dospert40_%d' % item for item in range(41, 81)]
+dospert40_tot_keys = dospert40_risktaking_keys + dospert40_riskperception_keys
+
+# Only the two totals are output; the domain scores are still checked, and a domain that fails its
+# check flags its total.
+def dospert40_domain(name, keys, high):
+	return subscale(name, None, [forward(keys, high=high)], n=8, check=range_check(None, 8, 56))
+
+dospert40 = Scale(dospert40_tot_keys, dospert_risk_labels,
+	[1, 2, 3, 4, 5, 999], 'dospert40_error', 'DOSPERT40', True,
+	[dospert40_domain('risktaking_social', risktaking_social_keys, 5),
+	dospert40_domain('risktaking_financial', risktaking_financial_keys, 5),
+	dospert40_domain('risktaking_healthsafety', risktaking_healthsafety_keys, 5),
+	dospert40_domain('risktaking_recreational', risktaking_recreational_keys, 7),
+	dospert40_domain('risktaking_ethical', risktaking_ethical_keys, 7),
+	dospert40_domain('riskperception_social', riskperception_social_keys, 7),
+	dospert40_domain('riskperception_financial', riskperception_financial_keys, 7),
+	dospert40_domain('riskperception_healthsafety', riskperception_healthsafety_keys, 7),
+	dospert40_domain('riskperception_recreational', riskperception_recreational_keys, 7),
+	dospert40_domain('riskperception_ethical', riskperception_ethical_keys, 7)],
+	[total('risktaking', columns('DOSPERT40_Risktaking_Total'), ['risktaking_social', 'risktaking_financial',
+		'risktaking_healthsafety', 'risktaking_recreational', 'risktaking_ethical'],
+		check=range_check('DOSPERT40_Risktaking_Total_Out_of_Range', 40, 112)),
+	total('riskperception', columns('DOSPERT40_Riskperception_Total'), ['riskperception_social', 'riskperception_financial',
+		'riskperception_healthsafety', 'riskperception_recreational', 'riskperception_ethical'],
+		check=range_check('DOSPERT40_Riskperception_Total_Out_of_Range', 40, 112))],
+	['risktaking', 'riskperception'])
+
+# ------------------------------------------------------------------------------
+# ECR-R10
+
+avoidance_forward_keys = ['ecrr10_1', 'ecrr10_3', 'ecrr10_5', 'ecrr10_7', 'ecrr10_9']
+anxiety_forward_keys = ['ecrr10_4', 'ecrr10_8', 'ecrr10_10']
+anxiety_reverse_keys = ['ecrr10_2', 'ecrr10_6']
+ecrr10_tot_keys = avoidance_forward_keys + anxiety_forward_keys + anxiety_reverse_keys
+
+# The anxiety score is prorated over its 3 forward items, as in ecrr10_scoring.py
+ecrr10 = Scale(ecrr10_tot_keys,
+	{'strongly disagree': 1, 'somewhat disagree': 2, 'slightly disagree': 3, 'neither agree nor disagree': 4,
+	'slightly agree': 5, 'somewhat agree': 6, 'strongly agree': 7},
+	[1, 2, 3, 4, 5, 6, 7, 999], 'ecrr10_error', 'ECR-R10', True,
+	[subscale('avoidance', columns('ECRR10_Avoidance'), [forward(avoidance_forward_keys, high=7)],
+		check=range_check('ECRR10_Avoidance_Out_of_Range', 5, 35)),
+	subscale('anxiety', columns('ECRR10_Anxiety'), [forward(anxiety_forward_keys, high=7),
+		reverse(anxiety_reverse_keys, 8, high=7, skipna=False)], n=3, check=range_check('ECRR10_Anxiety_Out_of_Range', 5, 35))],
+	[], ['avoidance', 'anxiety'])
+
+# ------------------------------------------------------------------------------
+# NEO-FFI
+
+neoffi_neuroticism_keys = ['neoffi_6', 'neoffi_11', 'neoffi_21', 'neoffi_26', 'neoffi_36', 'neoffi_41', 'neoffi_51', 'neoffi_56']
+neoffi_neuroticism_reverse_keys = ['neoffi_1', 'neoffi_16', 'neoffi_31', 'neoffi_46']
+neoffi_extraversion_keys = ['neoffi_2', 'neoffi_7', 'neoffi_17', 'neoffi_22', 'neoffi_32', 'neoffi_37', 'neoffi_47', 'neoffi_52']
+neoffi_extraversion_reverse_keys = ['neoffi_12', 'neoffi_27', 'neoffi_42', 'neoffi_57']
+neoffi_openness_keys = ['neoffi_13', 'neoffi_28', 'neoffi_43', 'neoffi_53', 'neoffi_58']
+neoffi_openness_reverse_keys = ['neoffi_3', 'neoffi_8', 'neoffi_18', 'neoffi_23', 'neoffi_33', 'neoffi_38', 'neoffi_48']
+neoffi_agreeableness_keys = ['neoffi_4', 'neoffi_19', 'neoffi_34', 'neoffi_49']
+neoffi_agreeableness_reverse_keys = ['neoffi_9', 'neoffi_14', 'neoffi_24', 'neoffi_29', 'neoffi_39', 'neoffi_44', 'neoffi_54',
+	'neoffi_59']
+neoffi_conscientiousness_keys = ['neoffi_5', 'neoffi_10', 'neoffi_20', 'neoffi_25', 'neoffi_35', 'neoffi_40', 'neoffi_50',
+	'neoffi_60']
+neoffi_conscientiousness_reverse_keys = ['neoffi_15', 'neoffi_30', 'neoffi_45', 'neoffi_55']
+neoffi_negative_affect_keys = ['neoffi_11']
+neoffi_negative_affect_reverse_keys = ['neoffi_1', 'neoffi_16', 'neoffi_31', 'neoffi_46']
+neoffi_self_reproach_keys = ['neoffi_6', 'neoffi_21', 'neoffi_26', 'neoffi_36', 'neoffi_41', 'neoffi_51', 'neoffi_56']
+neoffi_positive_affect_keys = ['neoffi_7', 'neoffi_37']
+neoffi_positive_affect_reverse_keys = ['neoffi_12', 'neoffi_42']
+neoffi_sociability_keys = ['neoffi_2', 'neoffi_17']
+neoffi_sociability_reverse_keys = ['neoffi_27', 'neoffi_57']
+neoffi_activity_keys = ['neoffi_22', 'neoffi_32', 'neoffi_47', 'neoffi_52']
+neoffi_aesthetic_interests_keys = ['neoffi_13', 'neoffi_43']
+neoffi_aesthetic_interests_reverse_keys = ['neoffi_23']
+neoffi_intellectual_interests_keys = ['neoffi_53', 'neoffi_58']
+neoffi_intellectual_interests_reverse_keys = ['neoffi_48']
+neoffi_unconventionality_reverse_keys = ['neoffi_3', 'neoffi_8', 'neoffi_18', 'neoffi_38']
+neoffi_nonantagonistic_orientation_keys = ['neoffi_19']
+neoffi_nonantagonistic_orientation_reverse_keys = ['neoffi_9', 'neoffi_14', 'neoffi_24', 'neoffi_29', 'neoffi_44', 'neoffi_54',
+	'neoffi_59']
+neoffi_prosocial_orientation_keys = ['neoffi_4', 'neoffi_34', 'neoffi_49']
+neoffi_prosocial_orientation_reverse_keys = ['neoffi_39']
+neoffi_orderliness_keys = ['neoffi_5', 'neoffi_10']
+neoffi_orderliness_reverse_keys = ['neoffi_15', 'neoffi_30', 'neoffi_55']
+neoffi_goal_striving_keys = ['neoffi_25', 'neoffi_35', 'neoffi_60']
+neoffi_dependability_keys = ['neoffi_20', 'neoffi_40', 'neoffi_50']
+neoffi_dependability_reverse_keys = ['neoffi_45']
+neoffi_tot_keys = (neoffi_neuroticism_keys + neoffi_neuroticism_reverse_keys + neoffi_extraversion_keys
+	+ neoffi_extraversion_reverse_keys + neoffi_openness_keys + neoffi_openness_reverse_keys + neoffi_agreeableness_keys
+	+ neoffi_agreeableness_reverse_keys + neoffi_conscientiousness_keys + neoffi_conscientiousness_reverse_keys)
+
+# NEO-FFI subscales are plain sums. "Prefer not to answer" is not scored as 2 (neoffi_scoring.py reads
+# the items before recoding them), it is left out like a blank.
+def neoffi_subscale(name, columns, keys, reverse_keys=None, flag=None):
+	groups = [forward(keys, 0, 4)]
+	if reverse_keys:
+		groups.append(reverse(reverse_keys, 4, high=4))
+	check = range_check(flag, 0, 48) if flag else None
+	return subscale(name, columns, groups, 'sum', check=check, blank_is_pna=(name == 'openness'))
+
+# Facet columns are named <prefix>_Prefer_Left_Blank, <prefix>_Prefer_Not_to_Answer and <prefix>_Score
+def facet_columns(prefix):
+	return (prefix + '_Prefer_Left_Blank', prefix + '_Prefer_Not_to_Answer', prefix + '_Score')
+
+neoffi = Scale(neoffi_tot_keys,
+	{'strongly disagree': 0, 'disagree': 1, 'neutral': 2, 'agree': 3, 'strongly agree': 4},
+	[0, 1, 2, 3, 4, 999], 'neoffi_error', 'NEO-FFI', True,
+	[neoffi_subscale('neuroticism', columns('NEO_N'), neoffi_neuroticism_keys, neoffi_neuroticism_reverse_keys, 'NEO_N_Out_of_Range'),
+	neoffi_subscale('negative_affect', columns('NEO_N_NA'), neoffi_negative_affect_keys, neoffi_negative_affect_reverse_keys),
+	neoffi_subscale('self_reproach', columns('NEO_N_SR'), neoffi_self_reproach_keys),
+	neoffi_subscale('extraversion', columns('NEO_E'), neoffi_extraversion_keys, neoffi_extraversion_reverse_keys, 'NEO_E_Out_of_Range'),
+	neoffi_subscale('positive_affect', (None, 'NEO_E_PA_Prefer_Not_to_Answer', 'NEO_E_PA_Score'), neoffi_positive_affect_keys,
+		neoffi_positive_affect_reverse_keys),
+	neoffi_subscale('sociability', facet_columns('NEO_E_S'), neoffi_sociability_keys, neoffi_sociability_reverse_keys),
+	neoffi_subscale('activity', facet_columns('NEO_E_A'), neoffi_activity_keys),
+	neoffi_subscale('openness', columns('NEO_O'), neoffi_openness_keys, neoffi_openness_reverse_keys, 'NEO_O_Out_of_Range'),
+	neoffi_subscale('aesthetic_interests', facet_columns('NEO_O_AI'), neoffi_aesthetic_interests_keys,
+		neoffi_aesthetic_interests_reverse_keys),
+	neoffi_subscale('intellectual_interests', facet_columns('NEO_O_II'), neoffi_intellectual_interests_keys,
+		neoffi_intellectual_interests_reverse_keys),
+	neoffi_subscale('unconventionality', facet_columns('NEO_O_U'), neoffi_unconventionality_reverse_keys),
+	neoffi_subscale('agreeableness', columns('NEO_A'), neoffi_agreeableness_keys, neoffi_agreeableness_reverse_keys,
+		'NEO_A_Out_of_Range'),
+	neoffi_subscale('nonantagonistic_orientation', facet_columns('NEO_A_NO'), neoffi_nonantagonistic_orientation_keys,
+		neoffi_nonantagonistic_orientation_reverse_keys),
+	neoffi_subscale('prosocial_orientation', facet_columns('NEO_A_PO'), neoffi_prosocial_orientation_keys,
+		neoffi_prosocial_orientation_reverse_keys),
+	neoffi_subscale('conscientiousness', columns('NEO_C'), neoffi_conscientiousness_keys, neoffi_conscientiousness_reverse_keys,
+		'NEO_C_Out_of_Range'),
+	neoffi_subscale('orderliness', facet_columns('NEO_C_O'), neoffi_orderliness_keys, neoffi_orderliness_reverse_keys),
+	neoffi_subscale('goal_striving', facet_columns('NEO_C_GS'), neoffi_goal_striving_keys),
+	neoffi_subscale('dependability', columns('NEO_C_D'), neoffi_dependability_keys, neoffi_dependability_reverse_keys)],
+	[], ['neuroticism', 'extraversion', 'openness', 'agreeableness', 'conscientiousness', 'negative_affect', 'self_reproach',
+	'positive_affect', 'sociability', 'activity', 'aesthetic_interests', 'intellectual_interests', 'unconventionality',
+	'nonantagonistic_orientation', 'prosocial_orientation', 'orderliness', 'goal_striving', 'dependability'])
+
+# ------------------------------------------------------------------------------
+# PSS
+
+pss_negative_keys_for = ['pss_1', 'pss_2', 'pss_3', 'pss_6', 'pss_9', 'pss_10']
+pss_positive_keys_reverse = ['pss_4', 'pss_5', 'pss_7', 'pss_8']
+pss_tot_keys = pss_negative_keys_for + pss_positive_keys_reverse
+
+pss = Scale(pss_tot_keys,
+	{'never': 0, 'almost never': 1, 'sometimes': 2, 'fairly often': 3, 'very often': 4},
+	[0, 1, 2, 3, 4, 999], 'pss_error', 'PSS', True,
+	[subscale('pss', columns('PSS'), [reverse(pss_positive_keys_reverse, 5, high=4), forward(pss_negative_keys_for, high=4)],
+		check=range_check('PSS_Out_of_Range', 0, 40))],
+	[], ['pss'])
+
+# ------------------------------------------------------------------------------
+# SAQ-A
+
+D1_headers = ['saqa_10', 'saqa_13', 'saqa_15', 'saqa_17', 'saqa_19', 'saqa_22']
+D2_headers = ['saqa_3', 'saqa_7', 'saqa_12', 'saqa_18', 'saqa_25', 'saqa_29']
+D3_headers = ['saqa_4', 'saqa_6', 'saqa_20', 'saqa_23', 'saqa_27', 'saqa_30']
+D4_headers = ['saqa_1', 'saqa_8', 'saqa_16', 'saqa_21', 'saqa_24', 'saqa_28']
+D5_headers = ['saqa_2', 'saqa_5', 'saqa_9', 'saqa_11', 'saqa_14', 'saqa_26']
+saqa_headers = D1_headers + D2_headers + D3_headers + D4_headers + D5_headers
+
+def saqa_domain(domain, keys, rule):
+	return subscale(domain, ('SAQA_%s_Left_Blank' % domain, 'SAQA_%s_Prefer_Not_to_Answer' % domain, 'SAQA_%s_Subscore' % domain),
+		[forward(keys, high=5)], rule, check=range_check('SAQA_%s_Out_of_Range' % domain, 6, 30))
+
+saqa = Scale(saqa_headers,
+	{'not at all or very slight': 1, 'slight': 2, 'moderate': 3, 'high': 4, 'very high or extremely high': 5},
+	[1, 2, 3, 4, 5, 999], 'saqa_error', 'SAQ-A', True,
+	[saqa_domain('D1', D1_headers, 'prorate'),
+	saqa_domain('D2', D2_headers, 'impute'),
+	saqa_domain('D3', D3_headers, 'impute'),
+	saqa_domain('D4', D4_headers, 'impute'),
+	saqa_domain('D5', D5_headers, 'impute')],
+	[total('total', ('SAQA_Total_Left_Blank', 'SAQA_Total_Prefer_to_Not_Answer', 'SAQA_Total_Score'), ['D1', 'D2', 'D3', 'D4', 'D5'],
+		check=range_check('SAQA_Total_Out_of_Range', 30, 150))],
+	['D1', 'D2', 'D3', 'D4', 'D5', 'total'])
+
+# ------------------------------------------------------------------------------
+# STAI
+
+stai_trait_keys = ['stai_3', 'stai_4', 'stai_6', 'stai_7', 'stai_9', 'stai_12', 'stai_13', 'stai_14', 'stai_17', 'stai_18']
+stai_trait_rev_keys = ['stai_1', 'stai_2', 'stai_5', 'stai_8', 'stai_10', 'stai_11', 'stai_15', 'stai_16', 'stai_19', 'stai_20']
+stai_state_keys = ['stai_22', 'stai_24', 'stai_25', 'stai_28', 'stai_29', 'stai_31', 'stai_32', 'stai_35', 'stai_37', 'stai_38',
+	'stai_40']
+stai_state_rev_keys = ['stai_21', 'stai_23', 'stai_26', 'stai_27', 'stai_30', 'stai_33', 'stai_34', 'stai_36', 'stai_39']
+stai_tot_keys = stai_trait_keys + stai_trait_rev_keys + stai_state_keys + stai_state_rev_keys
+
+stai = Scale(stai_tot_keys,
+	{'not at all': 1, 'almost never': 1, 'somewhat': 2, 'sometimes': 2, 'moderately so': 3, 'often': 3,
+	'very much so': 4, 'almost always': 4},
+	[1, 2, 3, 4, 999], 'stai_error', 'STAI', True,
+	[subscale('trait', columns('STAI_Trait'), [forward(stai_trait_keys, high=4), reverse(stai_trait_rev_keys, 5, high=4)],
+		zero_to_nan=True, check=range_check('STAI_Trait_Out_of_Range', 20, 80)),
+	subscale('state', columns('STAI_State'), [forward(stai_state_keys, high=4), reverse(stai_state_rev_keys, 5, high=4)],
+		zero_to_nan=True, check=range_check('STAI_State_Out_of_Range', 20, 80))],
+	[], ['trait', 'state'])
+
+# ------------------------------------------------------------------------------
+# Specs by scale name
+
+# Every scale of scale_registry, in the same order. Scales set to None have no spec yet and are
+# only scored by their *_analysis function.
+scale_specs = OrderedDict([
+	('ASI', asi),
+	('BAPQ', bapq),
+	('BARRATT', barratt),
+	('BIS/BAS', bisbas),
+	('DOSPERT(S)', dospert_s),
+	('DOSPERT(40)', dospert40),
+	('ECR-R10', ecrr10),
+	('NEO-FFI', neoffi),
+	('PANAS', None),
+	('PSS', pss),
+	('QIDS', None),
+	('A-RSQ', None),
+	('RSRI', None),
+	('SAQ-A', saqa),
+	('SNI', None),
+	('STAI', stai),
+	('TCI', None),
+])
@@ -0,0 +1,133 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Shared helpers used by the *_analysis functions
+
+# ------------------------------------------------------------------------------
+# Item validation
+
+# Result of validate_items: passed is True when every response is an accepted value,
+# offending_items lists the item columns holding at least one response that is not
+ItemValidation = namedtuple('ItemValidation', ['passed', 'offending_items'])
+
+# Check every item of a scale once, before it is scored. Blank responses are allowed;
+# responses that are not numbers still raise, as they did in each scorer's own check.
+def validate_items(df, keys, accepted_values):
+	items = df[keys].apply(pd.to_numeric, args=('raise',))
+	offending = items.notnull() & ~items.isin(accepted_values)
+	offending_items = [key for key in keys if offending[key].any()]
+	return ItemValidation(len(offending_items) == 0, offending_items)
+
+# ------------------------------------------------------------------------------
+# Response normalization
+
+# Lower-case and strip a set of distinct responses. The '99999' blank sentinel becomes NaN and one
+# NaN is added to the end of the table, so code -1 (a blank cell from pd.factorize) picks it.
+def clean_responses(values):
+	cleaned = pd.Series(values).astype(str).str.lower().str.strip()
+	cleaned = cleaned.replace(['99999'], [np.nan])
+	return pd.concat([cleaned, pd.Series([np.nan], dtype=cleaned.dtype)], ignore_index=True)
+
+# Spread a table of cleaned responses back over the rows using one code per row
+def expand_codes(cleaned, codes, index, name):
+	expanded = cleaned.iloc[codes]
+	expanded.index = index
+	expanded.name = name
+	return expanded
+
+# Lower-case and strip one column of responses. Each distinct response is cleaned once and the
+# cleaned values are then spread back over the rows, so the string work depends on how many
+# different answers an item has and not on the number of respondents. Blank cells stay NaN.
+def normalize_responses(column):
+	codes, uniques = pd.factorize(column)
+	return expand_codes(clean_responses(uniques), codes, column.index, column.name)
+
+# ------------------------------------------------------------------------------
+# Missing responses
+
+# Blank and "Prefer not to answer" counts of a scale's subscales: each maps a subscale to its counts per row
+MissingCounts = namedtuple('MissingCounts', ['blank', 'prefernotanswer'])
+
+# Count the blank and "Prefer not to answer" (999) responses of every subscale of a scale at once.
+# df holds the scale's responses with their text answers already replaced by numbers, and subscales
+# lists (subscale, item columns) pairs; a subscale can be any group of items the scorer counts. The
+# blank and 999 masks are built once for all the items, and every subscale is counted from them with
+# one product against an item-by-subscale indicator matrix.
+def missing_counts(df, subscales):
+	subscales = OrderedDict(subscales)
+	keys = []
+	for group in subscales.values():
+		keys += [key for key in group if key not in keys]
+	values = df[keys].apply(pd.to_numeric, args=('coerce',)).to_numpy(dtype=float)
+	indicator = np.zeros((len(keys), len(subscales)), dtype=np.int64)
+	for j, group in enumerate(subscales.values()):
+		for key in group:
+			indicator[keys.index(key), j] += 1
+	blank = np.isnan(values).astype(np.int64) @ indicator
+	prefernotanswer = (values == 999).astype(np.int64) @ indicator
+	return MissingCounts(OrderedDict((name, pd.Series(blank[:, j], index=df.index)) for j, name in enumerate(subscales)),
+		OrderedDict((name, pd.Series(prefernotanswer[:, j], index=df.index)) for j, name in enumerate(subscales)))
+
+# Count the responses of each row that are "Prefer not to answer" (999), across every column
+def prefer_not_to_answer_total(df):
+	return (df == 999).sum(axis=1)
+
+# ------------------------------------------------------------------------------
+# Score ranges
+
+# Flag the scores of a column that fall outside the values the scale can give, with one comparison for
+# the whole column. Blank scores are not flagged.
+def out_of_range(score, low, high):
+	return (score < low) | (score > high)
+
+# Store the float64 score columns of a scale's output as float32, which holds every score to well
+# within the precision the scores are reported at and halves their size
+def compact_scores(result):
+	if isinstance(result, pd.Series):
+		return result.astype(np.float32) if result.dtype == np.float64 else result
+	scores = [column for column, dtype in result.dtypes.items() if dtype == np.float64]
+	return result.astype(dict((column, np.float32) for column in scores)) if scores else result
+
+# Turn the float32 scores of an output into the float64 numbers the csv shows (41.6 rather than
+# 41.599998474121094), for the SQLite store and the JSON replies, which would otherwise show the float32 rounding
+def decimal_scores(result):
+	if isinstance(result, pd.Series):
+		return result.astype(str).astype(np.float64) if result.dtype == np.float32 else result
+	scores = [column for column, dtype in result.dtypes.items() if dtype == np.float32]
+	if not scores:
+		return result
+	return result.astype(dict((column, str) for column in scores)).astype(dict((column, np.float64) for column in scores))
+
+# Return one row per *_Out_of_Range column of the given outputs that flags any score: how many scores it
+# flags and the SUBJECT_ID of the first few of them. subject_ids gives the SUBJECT_ID of each row.
+def range_report(results, subject_ids, examples=5):
+	subject_ids = np.asarray(subject_ids)
+	rows = []
+	for result in results:
+		if isinstance(result, pd.Series):
+			result = result.to_frame()
+		for position, column in enumerate(result.columns):
+			if str(column).endswith('_Out_of_Range'):
+				flagged = result.iloc[:, position].eq(True).to_numpy()
+				if flagged.any():
+					rows.append((column, int(flagged.sum()), ' '.join(str(subject_id) for subject_id in subject_ids[flagged][:examples])))
+	return pd.DataFrame(rows, columns=['column', 'flagged', 'SUBJECT_IDs'])
+
+# Add up the range reports of several chunks of one export, keeping the first SUBJECT_IDs of each column
+def merge_range_reports(reports, examples=5):
+	merged = OrderedDict()
+	for report in reports:
+		for column, flagged, subject_ids in report.itertuples(index=False):
+			count, kept = merged.get(column, (0, []))
+			merged[column] = (count + flagged, kept + subject_ids.split(' ')[:examples - len(kept)])
+	return pd.DataFrame([(column, count, ' '.join(kept)) for column, (count, kept) in merged.items()],
+		columns=['column', 'flagged', 'SUBJECT_IDs'])
@@ -0,0 +1,183 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+import automatedreader
+import scale_registry
+import scoring_utils
+
+# SCORING SERVICE
+
+# A local HTTP service that scores respondent rows sent to it. POST to /score either a list of rows or
+#	{"rows": [...], "questionnaire_list": "ASI,PSS", "prefertonotanswer": "Prefer not to answer"}
+# where each row maps item columns (SUBJECT_ID, asi_1, ...) to responses as they appear in the export.
+# The reply is a list with one object per row, holding the columns the *_analysis functions produce.
+#
+# Requests that arrive within batch_ms of each other are scored together in one data frame, on a pool
+# of worker processes that is started once and kept running.
+
+# One queued request: its rows, settings and the Future its scores are handed back through
+ScoreRequest = namedtuple('ScoreRequest', ['rows', 'questionnaire_list', 'prefertonotanswer', 'future'])
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# Address and port the service listens on:
+	host= '127.0.0.1'
+	port= 8765
+
+	# Questionnaires scored when a request does not list its own:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,PSS,STAI'
+
+	# Define how "Prefer not to answer" responses are listed when a request does not say:
+	prefertonotanswer= "Prefer not to answer"
+
+	# Number of processes used to score the questionnaires side by side (None uses every core, 1 scores them one at a time):
+	max_workers= None
+
+	# Milliseconds to wait for more requests to score together with the first one:
+	batch_ms= 5
+
+	#------------------------------------------------------------------------------------
+	with scale_registry.scoring_pool(max_workers, scale_registry.selected_scales(questionnaire_list)) as executor:
+		server = make_server(host, port, questionnaire_list, prefertonotanswer, executor, batch_ms, max_workers or os.cpu_count())
+		print("Scoring service listening on http://%s:%d/score- press Ctrl-C to stop" % (host, port))
+		try:
+			server.serve_forever()
+		except KeyboardInterrupt:
+			print("Scoring service stopped")
+		finally:
+			server.server_close()
+
+
+# ------------------------------------------------------------------------------
+# Server
+
+# Return the HTTP server, with its batching thread already running. workers is the number of worker
+# processes to start before the first request arrives.
+def make_server(host, port, questionnaire_list, prefertonotanswer, executor=None, batch_ms=5, workers=0):
+	server = ThreadingHTTPServer((host, port), ScoringHandler)
+	server.daemon_threads = True
+	server.requests = queue.Queue()
+	server.questionnaire_list = questionnaire_list
+	server.prefertonotanswer = prefertonotanswer
+	if executor is not None:
+		for job in [executor.submit(scale_registry.warm_up) for i in range(workers)]:
+			job.result()
+	batcher = threading.Thread(target=batch_requests, args=(server.requests, executor, batch_ms / 1000.0))
+	batcher.daemon = True
+	batcher.start()
+	return server
+
+class ScoringHandler(BaseHTTPRequestHandler):
+
+	def do_POST(self):
+		if self.path != '/score':
+			self.send_json(404, {'error': 'POST rows to /score'})
+			return
+		try:
+			body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8'))
+			if not isinstance(body, dict):
+				body = {'rows': body}
+			rows = body['rows']
+			if isinstance(rows, dict):
+				rows = [rows]
+			if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+				raise ValueError("rows must be a list of objects")
+		except (ValueError, KeyError) as error:
+			self.send_json(400, {'error': 'Could not read the request: %s' % error})
+			return
+
+		request = ScoreRequest(rows, body.get('questionnaire_list', self.server.questionnaire_list),
+			body.get('prefertonotanswer', self.server.prefertonotanswer), Future())
+		self.server.requests.put(request)
+		try:
+			scores = request.future.result()
+		except Exception as error:
+			self.send_json(400, {'error': 'Could not score the rows: %s: %s' % (type(error).__name__, error)})
+			return
+		self.send_body(200, scoring_utils.decimal_scores(scores).to_json(orient='records'))
+
+	def send_json(self, status, contents):
+		self.send_body(status, json.dumps(contents))
+
+	def send_body(self, status, text):
+		body = text.encode('utf-8')
+		self.send_response(status)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+# ------------------------------------------------------------------------------
+# Batching
+
+# Take requests off the queue for as long as the service runs. After the first request of a batch,
+# wait up to batch_seconds for more, then score the requests that share settings in one data frame.
+def batch_requests(requests, executor, batch_seconds):
+	while True:
+		batch = [requests.get()]
+		deadline = time.monotonic() + batch_seconds
+		while True:
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				break
+			try:
+				batch.append(requests.get(timeout=remaining))
+			except queue.Empty:
+				break
+		groups = OrderedDict()
+		for request in batch:
+			groups.setdefault((request.questionnaire_list, request.prefertonotanswer), []).append(request)
+		for group in groups.values():
+			score_requests(group, executor)
+
+# Score a group of requests together and hand each its own rows of the result. A scale whose responses
+# fail validation is reported for the whole frame, so if the combined rows fail, or cannot be scored,
+# each request is scored on its own instead and only the request at fault gets the error.
+def score_requests(group, executor):
+	rows = [row for request in group for row in request.rows]
+	try:
+		scores = score_rows(rows, group[0].questionnaire_list, group[0].prefertonotanswer, executor)
+		failed = any(str(name).endswith('_error') for name in scores.columns)
+	except Exception as error:
+		if len(group) == 1:
+			group[0].future.set_exception(error)
+			return
+		failed = True
+	if failed and len(group) > 1:
+		for request in group:
+			score_requests([request], executor)
+		return
+	start = 0
+	for request in group:
+		stop = start + len(request.rows)
+		request.future.set_result(scores.iloc[start:stop])
+		start = stop
+
+# Score rows given as dicts of item columns and responses
+def score_rows(rows, questionnaire_list, prefertonotanswer, executor=None):
+	raw_data_frame = pd.DataFrame.from_records(rows)
+	return automatedreader.score_data_frame(raw_data_frame, list(raw_data_frame.columns), questionnaire_list, prefertonotanswer, executor)
+
+
+if __name__ == '__main__':
+	main()
@@ -28,13 +28,13 @@ therefore requires steps that are unlike those used in the other scoring program
 	
 # ------------------------------------------------------------------------------
 # Data Preparation 
+# These are the different headers and their corresponding questions
+sni_keys = ['sni_1', 'sni_2', 'sni_3','sni_4', 'sni_5', 'sni_6','sni_7', 'sni_8', 'sni_9','sni_10', 'sni_11', 'sni_12','sni_13', 'sni_14', 'sni_15','sni_16', 'sni_17', 'sni_18','sni_19', 'sni_20', 'sni_21','sni_22', 'sni_23', 'sni_24','sni_25', 'sni_26', 'sni_27','sni_28', 'sni_29']
+sni_score_keys = ['sni_1','sni_3','sni_5','sni_7','sni_9','sni_11','sni_13','sni_15','sni_17','sni_18','sni_19','sni_21','sni_22','sni_23','sni_24','sni_25','sni_26','sni_27','sni_28','sni_29']
+sni_group_keys=['sni_23','sni_24','sni_25','sni_26','sni_27','sni_28']
+sni_noblank_keys=['sni_1','sni_4','sni_5','sni_6','sni_7','sni_8','sni_9', 'sni_10', 'sni_11', 'sni_12','sni_14', 'sni_16', 'sni_19', 'sni_20', 'sni_22']
+
 def sni_analysis(df):
-	# These are the different headers and their corresponding questions
-	sni_keys = ['sni_1', 'sni_2', 'sni_3','sni_4', 'sni_5', 'sni_6','sni_7', 'sni_8', 'sni_9','sni_10', 'sni_11', 'sni_12','sni_13', 'sni_14', 'sni_15','sni_16', 'sni_17', 'sni_18','sni_19', 'sni_20', 'sni_21','sni_22', 'sni_23', 'sni_24','sni_25', 'sni_26', 'sni_27','sni_28', 'sni_29']
-	sni_score_keys = ['sni_1','sni_3','sni_5','sni_7','sni_9','sni_11','sni_13','sni_15','sni_17','sni_18','sni_19','sni_21','sni_22','sni_23','sni_24','sni_25','sni_26','sni_27','sni_28','sni_29']
-	sni_group_keys=['sni_23','sni_24','sni_25','sni_26','sni_27','sni_28']
-	sni_noblank_keys=['sni_1','sni_4','sni_5','sni_6','sni_7','sni_8','sni_9', 'sni_10', 'sni_11', 'sni_12','sni_14', 'sni_16', 'sni_19', 'sni_20', 'sni_22']
-	
 	# Count up the number of questions left blank or prefer not to answer
 	sni_prefernotanswer= df[sni_keys].apply(lambda x: sum(x==999), axis=1)
 	sni_leftblank= df[sni_noblank_keys].apply(lambda x: sum(x.isnull().values), axis=1)
@@ -0,0 +1,172 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import ast
+import inspect
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import scale_registry
+import scale_specs
+
+# SYNTHETIC EXPORTS
+
+# Writes made-up exports that look like the ones Qualtrics gives us, so the scoring can be run and timed
+# without participant data. Each item column holds the text answers its *_scoring.py module turns into
+# numbers, or the numeric codes it accepts where it has none, mixed with blank cells, "Prefer not to
+# answer" and, if asked for, codes the module does not accept. A column dictionary is written with it.
+#
+# The answers of a scale with a spec in scale_specs.py are its labels and accepted codes. Those of the
+# scales without one are read from their scoring modules: every df[keys].replace([labels], [values]) call
+# and the accepted values passed to scoring_utils.validate_items. Either way, labels that could never
+# match a cleaned (lower-cased) response are left out.
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# Define where the export and its column dictionary are saved:
+	datafilepath = '/Users/ra1/synthetic.csv'
+	headerfilepath= '/Users/ra1/synthetic_columndictionary.csv'
+
+	# List all of the questionnaires the export should hold:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,PSS,STAI'
+
+	# Number of respondents:
+	rows= 1000
+
+	# Share of responses left blank, answered "Prefer not to answer" and given a code the scale does not accept.
+	# Any invalid code makes its scale report an error instead of scores, so leave invalid_rate at 0 to time scoring:
+	blank_rate= 0.02
+	pna_rate= 0.01
+	invalid_rate= 0
+
+	# Define how "Prefer not to answer" responses are listed in the export:
+	prefertonotanswer= "Prefer not to answer"
+
+	# Seed for the random answers, so the same export can be made again:
+	seed= 0
+
+	#------------------------------------------------------------------------------------
+	write_export(datafilepath, headerfilepath, scale_registry.selected_scales(questionnaire_list), rows, blank_rate,
+		pna_rate, invalid_rate, prefertonotanswer, seed)
+	print("Your synthetic export has been saved- have a great day!")
+
+
+# ------------------------------------------------------------------------------
+# Answers
+
+# Return the value of an expression from a scoring module (a key list such as asi_tot_keys, a column
+# name or a list of numbers), or None when it cannot be worked out without running the module
+def module_value(module, node):
+	try:
+		return eval(compile(ast.Expression(node), '<%s>' % module.__name__, 'eval'), vars(module))
+	except Exception:
+		return None
+
+# Return the item columns a replace call or validate_items call is made on
+def call_columns(module, node):
+	if isinstance(node, ast.Subscript):
+		node = node.slice
+	columns = module_value(module, node)
+	if isinstance(columns, str):
+		return [columns]
+	if isinstance(columns, list):
+		return columns
+	return []
+
+# Return whether a label and the code it stands for can be given as a synthetic answer
+def answer_label(label, value):
+	return (isinstance(label, str) and label == label.lower().strip() and not label.isdigit()
+		and isinstance(value, (int, float)) and value != 999)
+
+# Return (answers, accepted) for a scale: answers maps each item column to the text answers scored for it
+# and the codes they stand for, accepted maps each item column to the numeric codes the scale accepts
+def scale_answers(name):
+	spec = scale_specs.scale_specs.get(name)
+	if spec is None:
+		return module_answers(name)
+	labels = OrderedDict((label, value) for label, value in spec.labels.items() if answer_label(label, value))
+	codes = [code for code in spec.accepted if code != 999]
+	return OrderedDict((key, labels) for key in spec.keys), OrderedDict((key, codes) for key in spec.keys)
+
+# Return scale_answers for a scale without a spec, read from the replace and validate_items calls of its module
+def module_answers(name):
+	module = inspect.getmodule(scale_registry.scale_analysis(name))
+	keys = scale_registry.load_scale(name)[1]
+	answers = OrderedDict((key, OrderedDict()) for key in keys)
+	accepted = OrderedDict((key, []) for key in keys)
+	for node in ast.walk(ast.parse(inspect.getsource(module))):
+		if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+			continue
+		if node.func.attr == 'replace' and len(node.args) == 2:
+			labels, values = module_value(module, node.args[0]), module_value(module, node.args[1])
+			if not (isinstance(labels, list) and isinstance(values, list)):
+				continue
+			for column in call_columns(module, node.func.value):
+				for label, value in zip(labels, values):
+					if column in answers and answer_label(label, value):
+						answers[column].setdefault(label, value)
+		elif node.func.attr == 'validate_items' and len(node.args) == 3:
+			values = module_value(module, node.args[2])
+			for column in call_columns(module, node.args[1]):
+				if column in accepted and isinstance(values, list):
+					accepted[column] = [value for value in values if value != 999]
+	return answers, accepted
+
+# Return the answers a respondent can give to each item column, and a code each column does not accept:
+# its text answers, then any accepted code none of them stands for. Scales that do not validate their
+# items are taken to accept 0 to 7.
+def column_answers(name):
+	answers, accepted = scale_answers(name)
+	options = OrderedDict()
+	for column, labels in answers.items():
+		codes = accepted[column] or list(range(8))
+		choices = [label[0].upper() + label[1:] for label in labels]
+		choices += [str(code) for code in codes if code not in labels.values()]
+		options[column] = (choices, str(max(codes) + 1))
+	return options
+
+# ------------------------------------------------------------------------------
+# Exports
+
+# Return a synthetic export of the named scales: SUBJECT_ID and each scale's item columns, as text
+def synthetic_frame(names, rows, blank_rate=0.02, pna_rate=0.01, invalid_rate=0, prefertonotanswer="Prefer not to answer", seed=0):
+	random = np.random.default_rng(seed)
+	columns = OrderedDict([('SUBJECT_ID', np.array(['S%07d' % row for row in range(rows)], dtype=object))])
+	for name in names:
+		for column, (choices, invalid) in column_answers(name).items():
+			if column in columns:
+				continue
+			values = np.array(choices, dtype=object)[random.integers(0, len(choices), rows)]
+			draw = random.random(rows)
+			values[draw < blank_rate + pna_rate + invalid_rate] = invalid
+			values[draw < blank_rate + pna_rate] = prefertonotanswer
+			values[draw < blank_rate] = np.nan
+			columns[column] = values
+	return pd.DataFrame(columns)
+
+# Write a synthetic export with Qualtrics-style headers (Q1, Q2, ...) and the column dictionary that names them
+def write_export(datafilepath, headerfilepath, names, rows, blank_rate=0.02, pna_rate=0.01, invalid_rate=0,
+		prefertonotanswer="Prefer not to answer", seed=0):
+	save_export(synthetic_frame(names, rows, blank_rate, pna_rate, invalid_rate, prefertonotanswer, seed), datafilepath, headerfilepath)
+
+# Write a frame from synthetic_frame as an export with Qualtrics-style headers, and its column dictionary
+def save_export(df, datafilepath, headerfilepath):
+	pd.DataFrame({'COLUMN_NAME': list(df.columns)}).to_csv(headerfilepath, index=False)
+	df = df.copy()
+	df.columns = ['Q%d' % (position + 1) for position in range(len(df.columns))]
+	df.to_csv(datafilepath, index=False)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,127 @@
+#!/usr/bin/python
+"""
+Battery Scores Package for Processing Qualtrics CSV Files
+
+@version: 1.0
+@date: 2026.10.18
+"""
+import asyncio
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import automatedreader
+import batchreader
+import scale_registry
+
+# WATCH FOLDER
+
+# Keeps running and scores every export that lands in watch_dir, and every export that changes, into
+# output_dir. The folder is checked every poll_seconds; an export is only scored once its size and
+# modification time stay the same between two checks, so files still being copied in are left alone.
+# Exports are scored by a pool of worker processes that import pandas and the selected scale modules when they
+# start. Stop the watcher with Ctrl-C.
+
+
+def main():
+
+	#------------------------------------------------------------------------------------
+	# Set your specific parameters here
+
+	# Define the folder the data csvs are dropped in:
+	watch_dir = '/Users/ra1/exports'
+
+	# Define the column dictionary used by exports without their own <name>_columndictionary.csv:
+	headerfilepath= '/Users/ra1/NFC_columndictionary.csv'
+
+	# List all of the questionnaires you plan on using:
+	#'ASI,BAPQ,BARRATT,BIS/BAS,DOSPERT(S),DOSPERT(40),ECR-R10,NEO-FFI,PANAS,PSS,QIDS,A-RSQ,RSRI,SAQ-A,SNI,STAI,TCI'
+	questionnaire_list= 'ASI,PSS,STAI'
+
+	# Define the folder the outputs are saved in:
+	output_dir= '/Users/ra1/scores'
+
+	# Define how "Prefer not to answer" responses are listed in your data:
+	prefertonotanswer= "Prefer not to answer"
+
+	# Number of exports scored side by side (None uses every core):
+	max_workers= None
+
+	# Seconds between checks of the folder:
+	poll_seconds= 5
+
+	# Settings passed on to automatedreader.score_export for every export (see automatedreader.main):
+	export_settings= {'chunksize': None, 'load_selected_columns': True, 'encoded_store_dir': None,
+		'incremental': False, 'result_cache_dir': None, 'result_cache_mb': 500, 'save_run_report': False,
+		'results_db': None, 'wave': None, 'score_from_codes': True,
+		'score_clean_rows': False}
+
+	#------------------------------------------------------------------------------------
+	print("Watching %s- press Ctrl-C to stop" % watch_dir)
+	try:
+		asyncio.run(watch(watch_dir, headerfilepath, questionnaire_list, output_dir, prefertonotanswer, max_workers,
+			poll_seconds, export_settings))
+	except KeyboardInterrupt:
+		print("Stopped watching %s" % watch_dir)
+
+
+# ------------------------------------------------------------------------------
+# Return the size and modification time of a file, or None if it is gone
+def file_signature(path):
+	try:
+		status = os.stat(path)
+	except OSError:
+		return None
+	return (status.st_size, status.st_mtime_ns)
+
+# ------------------------------------------------------------------------------
+# Watching
+
+# Check watch_dir every poll_seconds and queue exports that are new or changed and have stopped changing.
+# An export already scored before the watcher started is skipped if its output is newer than it.
+async def watch(watch_dir, headerfilepath, questionnaire_list, output_dir, prefertonotanswer, max_workers=None,
+		poll_seconds=5, export_settings=None):
+	if export_settings is None:
+		export_settings = {}
+	if not os.path.isdir(output_dir):
+		os.makedirs(output_dir)
+	workers = max_workers or os.cpu_count() or 1
+	loop = asyncio.get_running_loop()
+	scored = {}
+	last_seen = {}
+	# The event loop only keeps weak references to tasks, so running scoring tasks are held here until they finish
+	pending = set()
+	for datafilepath, dictionary in batchreader.find_exports(watch_dir, headerfilepath):
+		output_name = batchreader.output_path(output_dir, datafilepath, watch_dir)
+		if os.path.exists(output_name) and os.path.getmtime(output_name) >= os.path.getmtime(datafilepath):
+			scored[datafilepath] = file_signature(datafilepath)
+
+	names = tuple(scale_registry.selected_scales(questionnaire_list))
+	with ProcessPoolExecutor(max_workers=workers, initializer=scale_registry.warm_up, initargs=(names,)) as executor:
+		await asyncio.gather(*[loop.run_in_executor(executor, scale_registry.warm_up) for i in range(workers)])
+		while True:
+			for datafilepath, dictionary in batchreader.find_exports(watch_dir, headerfilepath):
+				signature = file_signature(datafilepath)
+				if signature is not None and signature != scored.get(datafilepath) and signature == last_seen.get(datafilepath):
+					scored[datafilepath] = signature
+					task = asyncio.ensure_future(score_file(loop, executor, datafilepath, dictionary, questionnaire_list,
+						batchreader.output_path(output_dir, datafilepath, watch_dir), prefertonotanswer, export_settings))
+					pending.add(task)
+					task.add_done_callback(pending.discard)
+				last_seen[datafilepath] = signature
+			await asyncio.sleep(poll_seconds)
+
+# Score one export on the pool. score_export moves the finished output into place in one step.
+async def score_file(loop, executor, datafilepath, dictionary, questionnaire_list, output_name, prefertonotanswer, export_settings):
+	job = functools.partial(automatedreader.score_export, datafilepath, dictionary, questionnaire_list, output_name,
+		prefertonotanswer, max_workers=1, **export_settings)
+	try:
+		await loop.run_in_executor(executor, job)
+	except Exception as error:
+		print("Could not score %s: %s" % (datafilepath, error))
+	else:
+		print("Scored %s into %s" % (datafilepath, output_name))
+
+
+if __name__ == '__main__':
+	main()